@@ -1,15 +1,36 @@
+import argparse
+from bisect import bisect_right
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import json
 import os
-from datetime import datetime, timedelta
+import re
+from datetime import date, datetime, timedelta
 import calendar
+import csv
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain, islice
+from operator import itemgetter
 
 # Define file paths for local data storage
 DATA_DIR = "academic_data"
 DB_FILE = os.path.join(DATA_DIR, "academic_system.db")
-CALENDAR_EVENTS_FILE = os.path.join(DATA_DIR, "calendar_events.json") # Still using JSON for calendar events for simplicity, could be moved to DB
+CALENDAR_EVENTS_FILE = os.path.join(DATA_DIR, "calendar_events.json") # Legacy JSON store, migrated into the calendar_events table on first run
+
+# Database table -> in-memory list attribute on AcademicManagementApp
+TABLE_ATTRIBUTES = {
+    "students": "students",
+    "faculty": "faculty",
+    "courses": "courses",
+    "routines": "schedules",
+    "attendance": "attendance_records",
+    "grades": "grades",
+    "calendar_events": "calendar_events",
+}
 
 # Nordic Color Palette
 NORDIC_COLORS = {
@@ -38,24 +59,202 @@ NORDIC_COLORS = {
 }
 
 
+# Database schema, applied with a single executescript() on startup
+SCHEMA_SQL = """
+-- Students Table
+CREATE TABLE IF NOT EXISTS students (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    student_id TEXT UNIQUE NOT NULL,
+    name TEXT NOT NULL,
+    major TEXT
+);
+-- Faculty Table
+CREATE TABLE IF NOT EXISTS faculty (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    faculty_id TEXT UNIQUE NOT NULL,
+    name TEXT NOT NULL,
+    department TEXT,
+    rank TEXT,
+    contact_info TEXT
+);
+-- Courses Table
+CREATE TABLE IF NOT EXISTS courses (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    course_code TEXT UNIQUE NOT NULL,
+    course_name TEXT NOT NULL,
+    program TEXT,
+    credits REAL,
+    prerequisites TEXT
+);
+-- Routines Table
+CREATE TABLE IF NOT EXISTS routines (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    course_code TEXT NOT NULL,
+    time_slot TEXT NOT NULL,
+    weekday TEXT NOT NULL,
+    FOREIGN KEY (course_code) REFERENCES courses (course_code)
+);
+-- Attendance Table
+CREATE TABLE IF NOT EXISTS attendance (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    student_id TEXT NOT NULL,
+    status TEXT NOT NULL, -- Present/Absent
+    date TEXT NOT NULL,
+    FOREIGN KEY (student_id) REFERENCES students (student_id)
+);
+-- Grades Table
+CREATE TABLE IF NOT EXISTS grades (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    student_id TEXT NOT NULL,
+    assessment_type TEXT NOT NULL,
+    marks REAL NOT NULL,
+    grade_point REAL NOT NULL,
+    FOREIGN KEY (student_id) REFERENCES students (student_id)
+);
+-- Calendar Events Table
+CREATE TABLE IF NOT EXISTS calendar_events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    date TEXT NOT NULL, -- YYYY-MM-DD
+    description TEXT NOT NULL,
+    type TEXT NOT NULL
+);
+-- Indexes on the calendar date and on the foreign-key columns used by per-student/per-course lookups
+CREATE INDEX IF NOT EXISTS idx_cal_date ON calendar_events(date);
+CREATE INDEX IF NOT EXISTS idx_att_student_date ON attendance(student_id, date);
+-- Covering indexes for the per-student summary GROUP BYs, read without touching the tables; they supersede the student_id-only ones
+DROP INDEX IF EXISTS idx_att_student;
+DROP INDEX IF EXISTS idx_grade_student;
+CREATE INDEX IF NOT EXISTS idx_att_student_status ON attendance(student_id, status);
+CREATE INDEX IF NOT EXISTS idx_grade_student_point ON grades(student_id, grade_point);
+CREATE INDEX IF NOT EXISTS idx_routine_course ON routines(course_code);
+"""
+
+
+def parse_date(text):
+    """Returns text as a zero-padded YYYY-MM-DD string, or None if it is not a valid date."""
+    try:
+        if len(text) == 10 and text[4] == '-' and text[7] == '-':
+            return date.fromisoformat(text).isoformat() # C fast path for the usual padded form
+        return datetime.strptime(text, "%Y-%m-%d").strftime("%Y-%m-%d") # e.g. 2024-5-1
+    except (TypeError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=128)
+def month_weeks(year, month):
+    """Returns the month's weeks as tuples of day numbers (0 outside the month), memoized since they never change."""
+    return tuple(map(tuple, calendar.Calendar().monthdayscalendar(year, month)))
+
+
+ROW_TAGS = (('evenrow',), ('oddrow',)) # Stripe tag tuple for a row, indexed by position & 1
+
+# Grading scale: marks below GRADE_THRESHOLDS[0] earn GRADE_POINTS[0]; reaching GRADE_THRESHOLDS[i] earns GRADE_POINTS[i + 1]
+GRADE_THRESHOLDS = (40, 45, 50, 55, 60, 65, 70, 75, 80)
+GRADE_POINTS = (0.00, 2.00, 2.25, 2.50, 2.75, 3.00, 3.25, 3.50, 3.75, 4.00)
+
+DAY_DIGITS = tuple(f"{day:02d}" for day in range(32)) # Zero-padded day of month, indexed by day number
+
+# Calendar day flag bits, and the bit each event type adds to its day
+EVENT_DAY, HOLIDAY_DAY, EXAM_DAY = 1, 2, 4
+DAY_TYPE_FLAGS = {'Holiday': HOLIDAY_DAY, 'Exam': EXAM_DAY}
+
+# Partial marks as typed: empty (initial entry), up to three digits, optionally a decimal part; add_grade() checks the range
+MARKS_INPUT = re.compile(r"\d{0,3}(?:\.\d*)?").fullmatch
+
+# Application type -> (subject, sentence after "I, <name>,", closing request) for the Document Generator, in menu order
+APPLICATION_TEMPLATES = {
+    "Class Reschedule": ("Request for Class Reschedule", "would like to request the rescheduling of my class due to the following reason:", "I kindly ask for your consideration and approval."),
+    "Requisition Request": ("Requisition Request", "request the requisition of the following materials:", "I hope for your prompt approval."),
+    "Leave Application": ("Leave Application", "request leave for the following reason(s):", "I shall be grateful for your kind consideration."),
+    "Recommendation Letter": ("Request for Recommendation Letter", "humbly request a recommendation letter for the following purpose:", "I appreciate your time and support."),
+    "Financial Assistance Request": ("Request for Financial Assistance", "am writing to request financial assistance due to:", "I sincerely hope for your positive response."),
+    "Makeup Exam Request": ("Request for Makeup Examination", "could not attend the examination due to the following reason(s):", "I kindly request to be allowed a makeup examination."),
+    "Add/Drop Course Request": ("Request to Add/Drop Course", "request to add/drop the following course(s):", "Thank you for your understanding and support."),
+    "Formal Letter to Registrar/Chairperson": ("Formal Letter", "am writing with the following matter:", "Your attention to this matter is greatly appreciated."),
+}
+
+# Row -> Treeview values tuple for the routine, attendance and grades lists, in C
+ROUTINE_ROW_VALUES = itemgetter('id', 'course_code', 'time_slot', 'weekday')
+ATTENDANCE_ROW_VALUES = itemgetter('id', 'student_id', 'status', 'date')
+GRADE_ROW_FIELDS = itemgetter('id', 'student_id', 'assessment_type', 'marks', 'grade_point')
+
+
+def grade_row_values(row):
+    """Returns a grade row's Treeview values, with the grade point shown to two decimals."""
+    db_id, student_id, assessment_type, marks, grade_point = GRADE_ROW_FIELDS(row)
+    return (db_id, student_id, assessment_type, marks, f"{grade_point:.2f}")
+
+
+def attendance_summary_values(students, student_id, tally):
+    """Returns an attendance summary row from a student's [present, total] tally."""
+    present, total = tally
+    student = students.get(student_id)
+    percentage = (present / total) * 100 if total > 0 else 0
+    return (student['name'] if student else student_id, total, present, total - present, f"{percentage:.2f}%")
+
+
+def gpa_summary_values(students, student_id, tally):
+    """Returns a GPA summary row from a student's [grade point sum, count] tally."""
+    total_points, count = tally
+    student = students.get(student_id)
+    overall_gpa = (total_points / count) if count > 0 else 0
+    return (student['name'] if student else student_id, f"{overall_gpa:.2f}")
+
+
+def append_rows(tree, rows):
+    """Appends (iid, values, tags) rows to a Treeview with direct Tcl calls, skipping Treeview.insert()'s per-row option formatting."""
+    call, widget = tree.tk.call, tree._w
+    for iid, values, tags in rows:
+        call(widget, "insert", "", "end", "-id", iid, "-values", values, "-tags", tags) # Tuples go over as Tcl lists as they are
+
+
+def configure_row_stripes(tree):
+    """Sets up the alternating 'evenrow'/'oddrow' background tags on a Treeview, once per widget."""
+    tree.tag_configure('oddrow', background=NORDIC_COLORS["treeview_row_bg1"])
+    tree.tag_configure('evenrow', background=NORDIC_COLORS["treeview_row_bg2"])
+
+
+def is_memory_db(db_path):
+    """Returns True if db_path names an in-memory SQLite database (plain or URI form)."""
+    return db_path == ":memory:" or (db_path.startswith("file:") and ("mode=memory" in db_path or db_path.startswith("file::memory:")))
+
+
 class DatabaseManager:
-    """Manages SQLite database operations for the Academic Management System."""
+    """Manages SQLite database operations for the Academic Management System (Tk main thread only)."""
     def __init__(self, db_path):
         self.db_path = db_path
         self.conn = None
+        self._cursor = None # Shared cursor reused by every one-shot query
+        self.on_change = None # Optional callback(table_name) fired after a successful write
+        self._stmt_cache = {} # (kind, table_name, columns) -> SQL text
+        self._versions = {} # table_name -> write counter, bumped by _changed() and invalidate()
+        self._fetch_cache = {} # table_name -> (version, rows) from the last fetch_all_data()
         self.connect()
         self.create_tables()
 
     def connect(self):
         """Establishes a connection to the SQLite database."""
         try:
-            self.conn = sqlite3.connect(self.db_path)
+            # uri=True also accepts shared in-memory databases such as "file::memory:?cache=shared"
+            self.conn = sqlite3.connect(self.db_path, cached_statements=256, uri=self.db_path.startswith("file:"))
             self.conn.row_factory = sqlite3.Row # Allows accessing columns by name
+            # WAL turns each commit into a log append instead of a full fsync
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.execute("PRAGMA temp_store=MEMORY")
+            self.conn.execute("PRAGMA cache_size=-20000") # ~20 MB page cache
+            self._cursor = self.conn.cursor()
             print(f"Connected to database: {self.db_path}")
         except sqlite3.Error as e:
             messagebox.showerror("Database Error", f"Failed to connect to database: {e}")
             self.conn = None
 
+    def _changed(self, table_name):
+        """Bumps the table's version and notifies the registered listener that it was modified."""
+        self._versions[table_name] = self._versions.get(table_name, 0) + 1
+        if self.on_change:
+            self.on_change(table_name)
+
     def close(self):
         """Closes the database connection."""
         if self.conn:
@@ -63,90 +262,66 @@ class DatabaseManager:
             print("Database connection closed.")
 
     def create_tables(self):
-        """Creates necessary tables if they don't exist."""
+        """Creates necessary tables and indexes if they don't exist."""
         if not self.conn:
             return
 
-        cursor = self.conn.cursor()
         try:
-            # Students Table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS students (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    student_id TEXT UNIQUE NOT NULL,
-                    name TEXT NOT NULL,
-                    major TEXT
-                )
-            """)
-            # Faculty Table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS faculty (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    faculty_id TEXT UNIQUE NOT NULL,
-                    name TEXT NOT NULL,
-                    department TEXT,
-                    rank TEXT,
-                    contact_info TEXT
-                )
-            """)
-            # Courses Table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS courses (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    course_code TEXT UNIQUE NOT NULL,
-                    course_name TEXT NOT NULL,
-                    program TEXT,
-                    credits REAL,
-                    prerequisites TEXT
-                )
-            """)
-            # Routines Table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS routines (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    course_code TEXT NOT NULL,
-                    time_slot TEXT NOT NULL,
-                    weekday TEXT NOT NULL,
-                    FOREIGN KEY (course_code) REFERENCES courses (course_code)
-                )
-            """)
-            # Attendance Table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS attendance (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    student_id TEXT NOT NULL,
-                    status TEXT NOT NULL, -- Present/Absent
-                    date TEXT NOT NULL,
-                    FOREIGN KEY (student_id) REFERENCES students (student_id)
-                )
-            """)
-            # Grades Table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS grades (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    student_id TEXT NOT NULL,
-                    assessment_type TEXT NOT NULL,
-                    marks REAL NOT NULL,
-                    grade_point REAL NOT NULL,
-                    FOREIGN KEY (student_id) REFERENCES students (student_id)
-                )
-            """)
-            self.conn.commit()
+            self.conn.executescript(SCHEMA_SQL) # Runs the whole schema in one pass and commits
             print("Tables checked/created successfully.")
         except sqlite3.Error as e:
             messagebox.showerror("Database Error", f"Failed to create tables: {e}")
 
-    def insert_data(self, table_name, data):
+    def _insert_sql(self, table_name, columns):
+        """Returns the cached INSERT statement for the given table and column tuple."""
+        key = ("insert", table_name, columns)
+        sql = self._stmt_cache.get(key)
+        if sql is None:
+            placeholders = ', '.join(['?' for _ in columns])
+            sql = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({placeholders})"
+            self._stmt_cache[key] = sql
+        return sql
+
+    def _update_sql(self, table_name, columns):
+        """Returns the cached UPDATE-by-id statement for the given table and column tuple."""
+        key = ("update", table_name, columns)
+        sql = self._stmt_cache.get(key)
+        if sql is None:
+            set_clause = ', '.join([f"{col} = ?" for col in columns])
+            sql = f"UPDATE {table_name} SET {set_clause} WHERE id = ?"
+            self._stmt_cache[key] = sql
+        return sql
+
+    def _delete_sql(self, table_name):
+        """Returns the cached DELETE-by-id statement for the given table."""
+        key = ("delete", table_name, ())
+        sql = self._stmt_cache.get(key)
+        if sql is None:
+            sql = f"DELETE FROM {table_name} WHERE id = ?"
+            self._stmt_cache[key] = sql
+        return sql
+
+    @contextmanager
+    def transaction(self):
+        """Groups writes made with commit=False into one commit; rolls back if the block raises."""
+        try:
+            yield self.conn
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+    def insert_data(self, table_name, data, commit=True):
         """Inserts a single record into the specified table."""
         if not self.conn:
             return False
-        columns = ', '.join(data.keys())
-        placeholders = ', '.join(['?' for _ in data.values()])
-        sql = f"INSERT INTO {table_name} ({columns}) VALUES ({placeholders})"
+        sql = self._insert_sql(table_name, tuple(data))
         try:
-            cursor = self.conn.cursor()
+            cursor = self._cursor
             cursor.execute(sql, tuple(data.values()))
-            self.conn.commit()
+            if commit:
+                self.conn.commit()
+            self._changed(table_name)
             return cursor.lastrowid
         except sqlite3.IntegrityError as e:
             messagebox.showwarning("Duplicate Entry", f"A record with this unique identifier already exists. Details: {e}")
@@ -155,29 +330,175 @@ class DatabaseManager:
             messagebox.showerror("Database Error", f"Failed to insert data into {table_name}: {e}")
             return False
 
+    def insert_many(self, table_name, rows):
+        """Inserts a list of records into the specified table in a single transaction."""
+        if not rows:
+            return 0 if self.conn else False
+        columns = tuple(rows[0])
+        return self.bulk_insert(table_name, columns, (tuple(row[col] for col in columns) for row in rows))
+
+    def _multi_insert_sql(self, table_name, columns, row_count):
+        """Returns the cached INSERT statement with row_count VALUES groups for the given table and column tuple."""
+        key = ("insert_many", table_name, columns, row_count)
+        sql = self._stmt_cache.get(key)
+        if sql is None:
+            group = f"({', '.join(['?'] * len(columns))})"
+            sql = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES {', '.join([group] * row_count)}"
+            self._stmt_cache[key] = sql
+        return sql
+
+    def bulk_insert(self, table_name, columns, rows, rebuild_indexes=False):
+        """Inserts an iterable of value tuples inside one transaction (a savepoint in an open one), many rows per INSERT statement.
+
+        With rebuild_indexes, the table's explicit indexes are dropped for the load and rebuilt once at the end.
+        """
+        if not self.conn:
+            return False
+        columns = tuple(columns)
+        sql = self._insert_sql(table_name, columns)
+        # 999 is SQLite's smallest compiled-in limit on bound parameters per statement
+        rows_per_statement = max(999 // len(columns), 1)
+        multi_sql = self._multi_insert_sql(table_name, columns, rows_per_statement)
+        rows = iter(rows)
+        inserted = 0
+        # Inside a caller's open transaction (e.g. transaction() with commit=False writes) nest under a savepoint,
+        # so success leaves the outer commit to the caller and failure undoes only this load
+        nested = self.conn.in_transaction
+        cursor = self._cursor
+
+        def undo():
+            if nested:
+                cursor.execute("ROLLBACK TO bulk_insert")
+                cursor.execute("RELEASE bulk_insert")
+            else:
+                self.conn.rollback()
+
+        try:
+            cursor.execute("SAVEPOINT bulk_insert" if nested else "BEGIN")
+            indexes = []
+            if rebuild_indexes:
+                # Autoindexes behind PRIMARY KEY/UNIQUE have no sql and stay, so constraints are still enforced per row
+                indexes = cursor.execute("SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL",
+                                         (table_name,)).fetchall()
+                for index in indexes:
+                    cursor.execute(f"DROP INDEX {index['name']}")
+            while True:
+                batch = list(islice(rows, rows_per_statement))
+                if len(batch) == rows_per_statement:
+                    cursor.execute(multi_sql, list(chain.from_iterable(batch)))
+                elif batch:
+                    cursor.executemany(sql, batch) # Short tail; not worth preparing a one-off statement
+                inserted += len(batch)
+                if len(batch) < rows_per_statement:
+                    break
+            for index in indexes:
+                cursor.execute(index['sql']) # DDL is transactional, so a rollback restores dropped indexes too
+            if nested:
+                cursor.execute("RELEASE bulk_insert")
+            else:
+                self.conn.commit()
+        except sqlite3.IntegrityError as e:
+            undo()
+            messagebox.showwarning("Duplicate Entry", f"One or more records already exist; nothing was inserted. Details: {e}")
+            return False
+        except sqlite3.Error as e:
+            undo()
+            messagebox.showerror("Database Error", f"Failed to insert data into {table_name}: {e}")
+            return False
+        except Exception:
+            undo() # The row source failed part-way (e.g. a bad line in a streamed file)
+            raise
+        if inserted:
+            self._changed(table_name)
+        return inserted
+
+    def invalidate(self, table_name=None):
+        """Drops cached fetch_all_data() results after writes made outside this class (e.g. raw executescript)."""
+        for name in (TABLE_ATTRIBUTES if table_name is None else (table_name,)):
+            self._fetch_cache.pop(name, None)
+            self._versions[name] = self._versions.get(name, 0) + 1 # So data_version() callers see the change too
+
+    def data_version(self):
+        """Returns a tuple that changes whenever any table is written through this class or invalidated."""
+        return tuple(self._versions.get(name, 0) for name in TABLE_ATTRIBUTES)
+
     def fetch_all_data(self, table_name):
-        """Fetches all records from the specified table."""
+        """Fetches all records from the specified table as sqlite3.Row objects.
+
+        The list is cached and the same list object is returned until the table's version changes; it is not a copy.
+        The app mirrors its own single-row writes into that list in place (see _apply_local_change), so it may also
+        hold plain dict rows with the same keys; readers should use row["col"] access only.
+        """
         if not self.conn:
             return []
-        cursor = self.conn.cursor()
+        version = self._versions.get(table_name, 0)
+        cached = self._fetch_cache.get(table_name)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        cursor = self._cursor
         try:
             cursor.execute(f"SELECT * FROM {table_name}")
-            return [dict(row) for row in cursor.fetchall()]
+            rows = cursor.fetchall() # Rows support row["col"] access; callers dict() them only when serializing
+            self._fetch_cache[table_name] = (version, rows)
+            return rows
         except sqlite3.Error as e:
             messagebox.showerror("Database Error", f"Failed to fetch data from {table_name}: {e}")
             return []
 
-    def update_data(self, table_name, record_id, data):
+    def dashboard_counts(self, start_date, end_date):
+        """Returns the students, faculty, courses, attendance, grades and upcoming-event counts in one query."""
+        if not self.conn:
+            return (0, 0, 0, 0, 0, 0)
+        try:
+            return tuple(self.conn.execute("""
+                SELECT (SELECT COUNT(*) FROM students),
+                       (SELECT COUNT(*) FROM faculty),
+                       (SELECT COUNT(*) FROM courses),
+                       (SELECT COUNT(*) FROM attendance),
+                       (SELECT COUNT(*) FROM grades),
+                       (SELECT COUNT(*) FROM calendar_events WHERE date BETWEEN ? AND ?)
+            """, (start_date, end_date)).fetchone())
+        except sqlite3.Error as e:
+            messagebox.showerror("Database Error", f"Failed to count records: {e}")
+            return (0, 0, 0, 0, 0, 0)
+
+    def fetch_attendance_summary(self):
+        """Returns (student_id, present, total) per student, aggregated by SQLite, in order of first record."""
+        if not self.conn:
+            return []
+        try:
+            return self.conn.execute("""
+                SELECT student_id, SUM(status = 'Present'), COUNT(*)
+                FROM attendance GROUP BY student_id ORDER BY MIN(id)
+            """).fetchall()
+        except sqlite3.Error as e:
+            messagebox.showerror("Database Error", f"Failed to summarize attendance: {e}")
+            return []
+
+    def fetch_gpa_summary(self):
+        """Returns (student_id, total grade points, grade count) per student, aggregated by SQLite, in order of first grade."""
+        if not self.conn:
+            return []
+        try:
+            return self.conn.execute("""
+                SELECT student_id, SUM(grade_point), COUNT(*)
+                FROM grades GROUP BY student_id ORDER BY MIN(id)
+            """).fetchall()
+        except sqlite3.Error as e:
+            messagebox.showerror("Database Error", f"Failed to summarize grades: {e}")
+            return []
+
+    def update_data(self, table_name, record_id, data, commit=True):
         """Updates a record in the specified table by its ID."""
         if not self.conn:
             return False
-        set_clause = ', '.join([f"{key} = ?" for key in data.keys()])
-        sql = f"UPDATE {table_name} SET {set_clause} WHERE id = ?"
-        values = list(data.values()) + [record_id]
+        sql = self._update_sql(table_name, tuple(data))
         try:
-            cursor = self.conn.cursor()
-            cursor.execute(sql, tuple(values))
-            self.conn.commit()
+            cursor = self._cursor
+            cursor.execute(sql, (*data.values(), record_id))
+            if commit:
+                self.conn.commit()
+            self._changed(table_name)
             return cursor.rowcount > 0
         except sqlite3.IntegrityError as e:
             messagebox.showwarning("Duplicate Entry", f"Cannot update: A record with this unique identifier already exists. Details: {e}")
@@ -186,23 +507,490 @@ class DatabaseManager:
             messagebox.showerror("Database Error", f"Failed to update data in {table_name}: {e}")
             return False
 
-    def delete_data(self, table_name, record_id):
+    def delete_data(self, table_name, record_id, commit=True):
         """Deletes a record from the specified table by its ID."""
         if not self.conn:
             return False
-        sql = f"DELETE FROM {table_name} WHERE id = ?"
+        sql = self._delete_sql(table_name)
         try:
-            cursor = self.conn.cursor()
+            cursor = self._cursor
             cursor.execute(sql, (record_id,))
-            self.conn.commit()
+            if commit:
+                self.conn.commit()
+            self._changed(table_name)
             return cursor.rowcount > 0
         except sqlite3.Error as e:
             messagebox.showerror("Database Error", f"Failed to delete data from {table_name}: {e}")
             return False
 
 
+class VirtualTreeview:
+    """Shows only the rows that fit in a ttk.Treeview's viewport and re-renders that window as the user scrolls."""
+    ROW_HEIGHT = 25 # Matches the Treeview style rowheight
+
+    def __init__(self, tree, scrollbar):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self._rows = [] # Full list of (iid, values) pairs
+        self._index = {} # str(iid) -> position in self._rows
+        self._start = 0 # Position of the first rendered row
+        self._visible = self._viewport_rows()
+        self._rendered = {} # str(iid) -> (values, tags) of the rows currently in the tree, in tree order
+        self._selected = None # Selected iid, remembered while it is scrolled out of the window
+        self._notified = None # Last iid handed to the select callback
+        self._select_callback = None
+
+        # The scrollbar spans the whole data set, not just the rendered rows
+        self.tree.configure(yscrollcommand="")
+        self.scrollbar.configure(command=self.yview)
+        self.tree.bind("<MouseWheel>", self._on_wheel)
+        self.tree.bind("<Button-4>", self._on_wheel)
+        self.tree.bind("<Button-5>", self._on_wheel)
+        self.tree.bind("<Up>", lambda event: self._on_arrow(-1))
+        self.tree.bind("<Down>", lambda event: self._on_arrow(1))
+        self.tree.bind("<Configure>", self._on_configure)
+
+    def _viewport_rows(self):
+        """Returns how many rows fit in the tree, falling back to its configured height before it is mapped."""
+        height = self.tree.winfo_height()
+        if height > 1:
+            return max(height // self.ROW_HEIGHT, 1) # One row's worth is taken by the heading
+        try:
+            return max(int(self.tree.cget("height")), 1)
+        except (TypeError, ValueError):
+            return 10
+
+    def set_rows(self, rows):
+        """Replaces the data set, keeping the scroll position and selection where still valid."""
+        self._rows = list(rows)
+        self._index = {str(iid): i for i, (iid, _) in enumerate(self._rows)}
+        self._sync_selection()
+        if self._selected not in self._index:
+            self._selected = None
+        self._start = self._clamp(self._start)
+        self._render()
+
+    def append_row(self, iid, values):
+        """Adds a row at the end, inserting it into the tree only if it lands inside the window."""
+        position = len(self._rows)
+        self._rows.append((iid, values))
+        self._index[str(iid)] = position
+        if position < self._start + self._visible:
+            tags = ROW_TAGS[position & 1]
+            self.tree.insert("", "end", iid=iid, values=values, tags=tags)
+            self._rendered[str(iid)] = (values, tags)
+        self._update_scrollbar()
+
+    def update_row(self, iid, values):
+        """Replaces one row's values, touching the tree only if the row is rendered."""
+        position = self._index.get(str(iid))
+        if position is None:
+            return # Not in this data set (a full refresh is pending)
+        self._rows[position] = (self._rows[position][0], values)
+        shown = self._rendered.get(str(iid))
+        if shown is not None:
+            self.tree.item(iid, values=values)
+            self._rendered[str(iid)] = (values, shown[1])
+
+    def remove_row(self, iid):
+        """Drops one row, re-rendering the window only if the row was in or above it."""
+        position = self._index.pop(str(iid), None)
+        if position is None:
+            return
+        del self._rows[position]
+        for i in range(position, len(self._rows)):
+            self._index[str(self._rows[i][0])] = i
+        if self._selected == str(iid):
+            self._selected = None
+            self._notified = None
+        if self._rendered.pop(str(iid), None) is not None:
+            self.tree.delete(iid)
+        if position < self._start + self._visible:
+            self._start = self._clamp(self._start)
+            self._render() # The rows below it move up and swap their stripe colours
+        else:
+            self._update_scrollbar()
+
+    def values(self, iid):
+        """Returns the values tuple of a row, whether or not it is currently rendered."""
+        return self._rows[self._index[str(iid)]][1]
+
+    def selection(self):
+        """Returns the selected iids; a single selection is still returned while it is scrolled out of view."""
+        selected = self.tree.selection()
+        self._sync_selection(selected)
+        if len(selected) > 1:
+            return tuple(str(iid) for iid in selected) # Extended selection within the window
+        return (self._selected,) if self._selected is not None else ()
+
+    def clear_selection(self):
+        """Deselects every row, including one scrolled out of view."""
+        self._selected = None
+        self._notified = None
+        self.tree.selection_remove(self.tree.selection())
+
+    def bind_select(self, callback):
+        """Calls callback(event) on real selection changes, ignoring ones caused by re-rendering the window."""
+        self._select_callback = callback
+        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+
+    def _sync_selection(self, selected=None):
+        """Folds the tree's current selection (fetched here unless the caller already has it) into the remembered one."""
+        if selected is None:
+            selected = self.tree.selection()
+        if selected:
+            self._selected = str(selected[0])
+        elif self._selected in self._rendered:
+            self._selected = None # Deselected while visible
+
+    def _on_select(self, event):
+        selected = self.tree.selection()
+        if not selected and self._selected is not None and self._selected not in self._rendered:
+            return # The selected row was only scrolled out of the window
+        self._sync_selection(selected)
+        if self._selected is not None and self._selected == self._notified:
+            return # Re-selected after scrolling back into view; the form already shows it
+        self._notified = self._selected
+        if self._select_callback:
+            self._select_callback(event)
+
+    def _clamp(self, start):
+        return max(0, min(start, len(self._rows) - self._visible))
+
+    def _render(self):
+        """Brings the tree in line with the rows of the current window, touching only the items that differ."""
+        tree = self.tree
+        self._sync_selection()
+        end = min(self._start + self._visible, len(self._rows))
+        row_tags = ROW_TAGS
+        wanted = {}
+        for i in range(self._start, end):
+            iid, values = self._rows[i]
+            wanted[str(iid)] = (iid, values, row_tags[i & 1])
+        rendered = self._rendered
+        stale = [key for key in rendered if key not in wanted]
+        if stale:
+            tree.delete(*stale)
+        # Kept items only need moving if the new window reorders them
+        kept = [key for key in rendered if key in wanted]
+        reordered = kept != [key for key in wanted if key in rendered]
+        insert, item, move = tree.insert, tree.item, tree.move
+        for offset, (key, (iid, values, tags)) in enumerate(wanted.items()):
+            shown = rendered.get(key)
+            if shown is None:
+                insert("", offset, iid=iid, values=values, tags=tags)
+                continue
+            if shown != (values, tags):
+                item(iid, values=values, tags=tags)
+            if reordered:
+                move(iid, "", offset)
+        self._rendered = {key: (values, tags) for key, (iid, values, tags) in wanted.items()}
+        if self._selected in self._rendered:
+            tree.selection_set(self._selected)
+        self._update_scrollbar()
+
+    def _update_scrollbar(self):
+        total = len(self._rows)
+        end = min(self._start + self._visible, total)
+        self.scrollbar.set(self._start / total if total else 0.0, end / total if total else 1.0)
+
+    def _scroll_to(self, start):
+        start = self._clamp(start)
+        if start != self._start:
+            self._start = start
+            self._render()
+
+    def yview(self, *args):
+        """Scrollbar command: handles 'moveto' fractions and 'scroll' unit/page steps."""
+        if not args:
+            return
+        if args[0] == "moveto":
+            self._scroll_to(int(float(args[1]) * len(self._rows)))
+        elif args[0] == "scroll":
+            step = int(args[1]) * (self._visible if args[2] == "pages" else 1)
+            self._scroll_to(self._start + step)
+
+    def _on_wheel(self, event):
+        if getattr(event, "num", None) == 4:
+            step = -3
+        elif getattr(event, "num", None) == 5:
+            step = 3
+        else:
+            step = -3 if event.delta > 0 else 3
+        self._scroll_to(self._start + step)
+        return "break"
+
+    def _on_arrow(self, step):
+        """Moves the selection past the edge of the window by scrolling it one row."""
+        children = self.tree.get_children()
+        focus = self.tree.focus()
+        if not children or focus != (children[0] if step < 0 else children[-1]):
+            return None # Let the Treeview handle movement inside the window
+        position = self._index[str(focus)] + step
+        if not 0 <= position < len(self._rows):
+            return "break"
+        self._scroll_to(self._start + step)
+        iid = str(self._rows[position][0])
+        self.tree.selection_set(iid)
+        self.tree.focus(iid)
+        return "break"
+
+    def _on_configure(self, event):
+        visible = self._viewport_rows()
+        if visible != self._visible:
+            self._visible = visible
+            self._start = self._clamp(self._start)
+            self._render()
+
+
+@dataclass(frozen=True)
+class ColumnSpec:
+    """One editable column of a CrudTab: its form field and its Treeview column."""
+    key: str # Column name in the database table
+    label: str # Form label, also used in validation messages
+    width: int # Treeview column width
+    anchor: str = "w"
+    entry_width: int = 30
+    heading: str = None # Treeview heading, if shorter than the form label
+    required: bool = False
+    unique: bool = False # Backed by a UNIQUE constraint; duplicates are caught before reaching the database
+    numeric: bool = False # Stored as a float; non-numeric input is rejected
+
+
+STUDENT_COLUMNS = (
+    ColumnSpec("student_id", "Student ID", 100, anchor="center", required=True, unique=True),
+    ColumnSpec("name", "Name", 200, entry_width=40, required=True),
+    ColumnSpec("major", "Major", 150),
+)
+FACULTY_COLUMNS = (
+    ColumnSpec("faculty_id", "Faculty ID", 100, anchor="center", required=True, unique=True),
+    ColumnSpec("name", "Name", 150, entry_width=40, required=True),
+    ColumnSpec("department", "Department", 100),
+    ColumnSpec("rank", "Rank", 80),
+    ColumnSpec("contact_info", "Contact Info", 150, entry_width=40),
+)
+COURSE_COLUMNS = (
+    ColumnSpec("course_code", "Course Code", 80, anchor="center", heading="Code", required=True, unique=True),
+    ColumnSpec("course_name", "Course Name", 200, entry_width=40, heading="Name", required=True),
+    ColumnSpec("program", "Program", 100),
+    ColumnSpec("credits", "Credits", 60, anchor="center", entry_width=10, numeric=True),
+    ColumnSpec("prerequisites", "Prerequisites", 150, entry_width=40),
+)
+
+
+class CrudTab:
+    """Add/edit form, virtualized listing and add/edit/delete handlers for a table edited one row at a time."""
+    def __init__(self, app, frame_name, table_name, columns, title, form_title, list_title, item_label, noun, buttons=()):
+        self.app = app
+        self.table_name = table_name
+        self.columns = columns
+        self.item_label = item_label # e.g. "Student", as in "Add Student"
+        self.noun = noun # e.g. "faculty member", as in "Please select a faculty member"
+        self.name_key = columns[1].key # Column naming a row in confirmations
+        self._row_values = itemgetter("id", *(column.key for column in columns)) # Row -> Treeview values tuple, in C
+        self.selected_id = None # DB row ID being edited
+        self.unique_column = next((column for column in columns if column.unique), None)
+        self._unique_position = columns.index(self.unique_column) + 1 if self.unique_column else None # In the values tuple
+        self._selected_unique = None # Unique column value of the row being edited
+        self._unique_cache = None # (row list, set of its unique column values)
+        self.vars = {} # Column key -> StringVar bound to its entry; set() is one Tcl call where delete/insert was two
+
+        tab_frame = ttk.Frame(app.frames[frame_name], padding="20", style='TFrame')
+        tab_frame.pack(expand=True, fill="both")
+
+        tk.Label(tab_frame, text=title, font=('Arial', 20, 'bold'),
+                 bg=NORDIC_COLORS["bg_light"], fg=NORDIC_COLORS["accent_dark_blue"]).pack(pady=15)
+
+        input_frame = tk.LabelFrame(tab_frame, text=form_title, padx=15, pady=15,
+                                    bg=NORDIC_COLORS["bg_light"], fg=NORDIC_COLORS["text_dark"],
+                                    font=('Arial', 11, 'bold'), relief="solid", borderwidth=1)
+        input_frame.pack(pady=10, fill="x")
+
+        for row, column in enumerate(columns):
+            tk.Label(input_frame, text=f"{column.label}:", bg=NORDIC_COLORS["bg_light"], fg=NORDIC_COLORS["text_dark"]).grid(row=row, column=0, padx=5, pady=5, sticky="w")
+            self.vars[column.key] = tk.StringVar()
+            ttk.Entry(input_frame, textvariable=self.vars[column.key], width=column.entry_width).grid(row=row, column=1, padx=5, pady=5, sticky="ew")
+
+        button_row_frame = ttk.Frame(input_frame, style='TFrame')
+        button_row_frame.grid(row=len(columns), column=0, columnspan=2, pady=10)
+
+        self.add_button = ttk.Button(button_row_frame, text=f"Add {item_label}", command=self.add, style='TButton')
+        self.add_button.pack(side="left", padx=5)
+        self.edit_button = ttk.Button(button_row_frame, text="Update Selected", command=self.edit, state=tk.DISABLED, style='TButton')
+        self.edit_button.pack(side="left", padx=5)
+        self.cancel_edit_button = ttk.Button(button_row_frame, text="Cancel Edit", command=self.clear, state=tk.DISABLED, style='TButton')
+        self.cancel_edit_button.pack(side="left", padx=5)
+
+        input_frame.grid_columnconfigure(1, weight=1)
+
+        display_frame = tk.LabelFrame(tab_frame, text=list_title, padx=15, pady=15,
+                                      bg=NORDIC_COLORS["bg_light"], fg=NORDIC_COLORS["text_dark"],
+                                      font=('Arial', 11, 'bold'), relief="solid", borderwidth=1)
+        display_frame.pack(pady=10, fill="both", expand=True)
+
+        self.tree = ttk.Treeview(display_frame, columns=("id",) + tuple(c.key for c in columns), show="headings")
+        configure_row_stripes(self.tree)
+        self.tree.heading("id", text="DB ID")
+        self.tree.column("id", width=50, anchor="center")
+        for column in columns:
+            self.tree.heading(column.key, text=column.heading or column.label)
+            self.tree.column(column.key, width=column.width, anchor=column.anchor)
+        self.tree.pack(side="left", fill="both", expand=True)
+
+        scrollbar = ttk.Scrollbar(display_frame, orient="vertical", command=self.tree.yview)
+        scrollbar.pack(side="right", fill="y")
+        self.view = VirtualTreeview(self.tree, scrollbar)
+
+        self.tree.bind("<Delete>", lambda event: self.delete())
+        self.view.bind_select(self.on_select)
+        # Rows are filled by refresh() when the tab is shown
+
+        # Bottom buttons
+        bottom_button_frame = ttk.Frame(tab_frame, style='TFrame')
+        bottom_button_frame.pack(pady=10)
+        ttk.Button(bottom_button_frame, text="Delete Selected", command=self.delete, style='Danger.TButton').pack(side="left", padx=5)
+        for text, command in buttons:
+            ttk.Button(bottom_button_frame, text=text, command=command, style='TButton').pack(side="left", padx=5)
+
+    def _form_data(self):
+        """Returns the form as a column -> value dict, or None after warning about invalid input."""
+        data = {column.key: self.vars[column.key].get().strip() for column in self.columns}
+        required = [column for column in self.columns if column.required]
+        if not all(data[column.key] for column in required):
+            messagebox.showwarning("Input Error", f"{' and '.join(column.label for column in required)} are required.", parent=self.app)
+            return None
+        for column in self.columns:
+            if column.numeric:
+                try:
+                    data[column.key] = float(data[column.key])
+                except ValueError:
+                    messagebox.showwarning("Input Error", f"{column.label} must be a number.", parent=self.app)
+                    return None
+        return data
+
+    def _unique_values(self):
+        """Returns the set of values in the unique column, rebuilt only when the table's list is reloaded."""
+        rows = self.app._load_table(self.table_name)
+        if self._unique_cache is None or self._unique_cache[0] is not rows:
+            key = self.unique_column.key
+            self._unique_cache = (rows, {row[key] for row in rows})
+        return self._unique_cache[1]
+
+    def _is_duplicate(self, data, current=None):
+        """Warns and returns True if data's unique value belongs to another row; current is the edited row's own value."""
+        if self.unique_column is None:
+            return False
+        value = data[self.unique_column.key]
+        if value != current and value in self._unique_values():
+            messagebox.showwarning("Duplicate Entry", f"{self.unique_column.label} '{value}' already exists.", parent=self.app)
+            return True
+        return False
+
+    def add(self):
+        data = self._form_data()
+        if data is None or self._is_duplicate(data):
+            return
+        self.app._load_table(self.table_name) # Make sure the in-memory list is current before patching it
+        new_id = self.app.db_manager.insert_data(self.table_name, data)
+        if new_id:
+            self.app.show_status(f"{self.item_label} '{data[self.name_key]}' added successfully.")
+            self.clear()
+            row = {"id": new_id, **data}
+            self.app._apply_local_change(self.table_name, new_id, row) # Before _unique_values(), which would reload a stale list
+            if self.unique_column:
+                self._unique_values().add(row[self.unique_column.key])
+            self.view.append_row(new_id, self._row_values(row))
+
+    def edit(self):
+        if not self.selected_id:
+            messagebox.showwarning("No Selection", f"Please select a {self.noun} to update.", parent=self.app)
+            return
+        data = self._form_data()
+        if data is None or self._is_duplicate(data, current=self._selected_unique):
+            return
+        self.app._load_table(self.table_name)
+        record_id, old_unique = self.selected_id, self._selected_unique
+        if self.app.db_manager.update_data(self.table_name, record_id, data):
+            self.app.show_status(f"{self.item_label} '{data[self.name_key]}' updated successfully.")
+            self.clear()
+            row = {"id": record_id, **data}
+            self.app._apply_local_change(self.table_name, record_id, row)
+            if self.unique_column:
+                unique_values = self._unique_values()
+                unique_values.discard(old_unique)
+                unique_values.add(row[self.unique_column.key])
+            self.view.update_row(record_id, self._row_values(row))
+        else:
+            messagebox.showerror("Update Failed", f"Could not update {self.item_label.lower()}. Check for duplicate {self.columns[0].label}.", parent=self.app)
+
+    def delete(self):
+        selected_items = self.view.selection()
+        if not selected_items:
+            messagebox.showwarning("No Selection", f"Please select a {self.noun} to delete.", parent=self.app)
+            return
+
+        selected_values = [self.view.values(iid) for iid in selected_items]
+        if len(selected_values) == 1:
+            name = selected_values[0][2]
+            prompt = f"Are you sure you want to delete {self.noun} '{name}'?"
+        else:
+            prompt = f"Are you sure you want to delete the {len(selected_values)} selected records?"
+
+        if messagebox.askyesno("Confirm Delete", prompt, parent=self.app):
+            db_manager = self.app.db_manager
+            self.app._load_table(self.table_name)
+            deleted = []
+            # One commit for the whole selection instead of one per row
+            with db_manager.transaction():
+                for values in selected_values:
+                    if db_manager.delete_data(self.table_name, values[0], commit=False):
+                        deleted.append(values)
+            if not deleted:
+                messagebox.showerror("Delete Failed", f"Could not delete {self.noun}.", parent=self.app)
+                return
+            self.clear()
+            for values in deleted:
+                self.app._apply_local_change(self.table_name, values[0])
+                if self.unique_column:
+                    self._unique_values().discard(values[self._unique_position])
+                self.view.remove_row(values[0])
+            if len(deleted) == 1:
+                self.app.show_status(f"{self.item_label} '{deleted[0][2]}' deleted successfully.")
+            else:
+                self.app.show_status(f"Deleted {len(deleted)} records.")
+
+    def refresh(self):
+        rows = getattr(self.app, TABLE_ATTRIBUTES[self.table_name])
+        self.view.set_rows([(values[0], values) for values in map(self._row_values, rows)])
+
+    def on_select(self, event):
+        selected_items = self.view.selection()
+        if selected_items:
+            values = self.view.values(selected_items[0])
+            self.selected_id = values[0] # Store DB ID
+            if self.unique_column:
+                self._selected_unique = values[self._unique_position]
+            for column, value in zip(self.columns, values[1:]):
+                self.vars[column.key].set(str(value))
+            self.add_button.config(state=tk.DISABLED)
+            self.edit_button.config(state=tk.NORMAL)
+            self.cancel_edit_button.config(state=tk.NORMAL)
+        else:
+            self.clear()
+
+    def clear(self):
+        self.selected_id = None
+        self._selected_unique = None
+        for var in self.vars.values():
+            var.set("")
+        self.add_button.config(state=tk.NORMAL)
+        self.edit_button.config(state=tk.DISABLED)
+        self.cancel_edit_button.config(state=tk.DISABLED)
+        self.view.clear_selection()
+
+
 class AcademicManagementApp(tk.Tk):
-    def __init__(self):
+    def __init__(self, db_path=None, background_io=True):
         super().__init__()
 
         self.title("ELL AMS") # Changed app title
@@ -246,7 +1034,7 @@ class AcademicManagementApp(tk.Tk):
         self.style.map('Treeview',
                        background=[('selected', NORDIC_COLORS["treeview_selected_bg"])],
                        foreground=[('selected', NORDIC_COLORS["text_dark"])])
-        # Removed tag_configure from here, will be configured on each Treeview instance
+        # Row stripe tags are per widget; configure_row_stripes() sets them when each Treeview is created
 
 
         # Notebook (Tab) styles
@@ -276,45 +1064,60 @@ class AcademicManagementApp(tk.Tk):
                              foreground=NORDIC_COLORS["accent_blue"], background=NORDIC_COLORS["bg_light"])
 
 
-        # Ensure data directory exists
-        os.makedirs(DATA_DIR, exist_ok=True)
+        # Database location: explicit argument, then the AMS_DB environment variable, then the data directory
+        db_path = db_path or os.environ.get("AMS_DB") or DB_FILE
 
         # Initialize Database Manager
-        self.db_manager = DatabaseManager(DB_FILE)
+        if not is_memory_db(db_path):
+            os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True) # Ensure data directory exists
+        self.db_manager = DatabaseManager(db_path)
+        self.db_manager.on_change = self._notify_mutation
+        self._dirty = dict.fromkeys(TABLE_ATTRIBUTES, True) # Tables whose in-memory copy is stale
+        self._pending = {} # Debounce key -> pending after() id
+        self._status_after = None # after() id that clears the status bar
+        self._dashboard_dirty = False # A Dashboard refresh is already queued for the next idle moment
+        self._dashboard_shown = None # (data version, date) the Dashboard cards were last filled for
+        self._row_positions = {} # Table -> (row list, {row id: position in it}) for single-row patches
+        self._index_cache = {} # (table, columns) -> (row list, {value: row}) for code/ID and slot lookups; (table, column, list) -> grouped rows
+        self._combobox_values = {} # Combobox -> (source iterable, tuple of values last assigned to it)
+        # File exports run on one worker thread; background_io=False keeps them inline (e.g. for scripted runs)
+        self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="export") if background_io else None
+        self._day_flags = None # (events-by-date map, {date: day flag bits}) for the calendar painter
+        self._attendance_counts = None # (attendance row list, {student_id: [present, total]}) kept in step with single-row writes
+        self._gpa_totals = None # (grades row list, {student_id: [grade point sum, count]}) kept in step the same way
+        self._summary_sources = {} # Summary debounce key -> the tally dict its tree was last fully built from
+        self.current_frame = None
+        if not is_memory_db(db_path):
+            self.migrate_calendar_events_json() # A throwaway database must not consume the real events file
 
-        # Load initial data (from DB and JSON for calendar events)
-        self.schedules = self.db_manager.fetch_all_data("routines")
-        self.attendance_records = self.db_manager.fetch_all_data("attendance")
-        self.grades = self.db_manager.fetch_all_data("grades")
-        self.students = self.db_manager.fetch_all_data("students")
-        self.faculty = self.db_manager.fetch_all_data("faculty")
-        self.courses = self.db_manager.fetch_all_data("courses")
-        self.calendar_events = self.load_json_data(CALENDAR_EVENTS_FILE) # Calendar events still in JSON
+        # Load initial data
+        for table_name in TABLE_ATTRIBUTES:
+            self._load_table(table_name)
 
         # Variables for editing - Initialize all Treeview and other widget references to None
-        self.selected_student_id = None # Actual DB row ID for students
-        self.selected_faculty_id = None
-        self.selected_course_id = None
         self.selected_routine_id = None
         self.selected_attendance_id = None
         self.selected_grade_id = None
 
-        self.student_tree = None
-        self.faculty_tree = None
-        self.course_tree = None
+        self.students_tab = None
+        self.faculty_tab = None
+        self.courses_tab = None
         self.routine_tree = None
         self.attendance_tree = None
         self.summary_tree = None
         self.grades_tree = None
         self.gpa_summary_tree = None
         self.event_list_tree = None
-        self.calendar_grid_frame = None
+        self.calendar_canvas = None
+        self.calendar_weeks = () # month_weeks() rows currently painted on the canvas
+        self._calendar_cells = [] # (rectangle, text) canvas item ids per day cell, reused by every paint
+        self._listed_events = {} # Event list iid -> the event row it shows
         self.month_year_label = None
 
 
         # Calendar state
-        self.current_year = datetime.now().year
-        self.current_month = datetime.now().month
+        today = date.today() # One clock read, so the year and month cannot straddle a month boundary
+        self.current_year, self.current_month = today.year, today.month
 
         self.create_tabs()
 
@@ -324,11 +1127,258 @@ class AcademicManagementApp(tk.Tk):
     def on_closing(self):
         """Handles actions when the application window is closed."""
         if messagebox.askokcancel("Quit", "Do you want to quit the application?", parent=self):
+            if self._io_executor is not None:
+                self._io_executor.shutdown(wait=True) # Let a running export finish writing its file
             self.db_manager.close()
             self.destroy()
 
+    def show_status(self, message, clear_ms=4000):
+        """Shows a confirmation in the status bar without blocking, clearing it after clear_ms."""
+        self.status_var.set(message)
+        if self._status_after is not None:
+            self.after_cancel(self._status_after)
+        self._status_after = self.after(clear_ms, self._clear_status)
+
+    def _clear_status(self):
+        self._status_after = None
+        self.status_var.set("")
+
+    def _debounced(self, key, fn, delay_ms=50, immediate=False):
+        """Schedules fn after delay_ms, replacing any call still pending under the same key.
+
+        With immediate, the pending call is dropped and fn runs now instead (e.g. when its tab is shown).
+        """
+        pending = self._pending.pop(key, None)
+        if pending is not None:
+            self.after_cancel(pending)
+        if immediate:
+            fn()
+            return
+        self._pending[key] = self.after(delay_ms, self._run_pending, key, fn)
+
+    def _run_pending(self, key, fn):
+        """Runs a debounced callback and forgets its pending id."""
+        self._pending.pop(key, None)
+        fn()
+
+    def _notify_mutation(self, table_name):
+        """Marks a table's in-memory copy as stale and schedules a Dashboard refresh if it is showing."""
+        self._dirty[table_name] = True
+        if self.current_frame is not None and self.current_frame is self.frames.get("Dashboard"):
+            self._schedule_dashboard()
+
+    def _schedule_dashboard(self):
+        """Coalesces a burst of writes into a single Dashboard refresh once Tk goes idle."""
+        if not self._dashboard_dirty:
+            self._dashboard_dirty = True
+            self.after_idle(self._flush_dashboard)
+
+    def _flush_dashboard(self):
+        self._dashboard_dirty = False
+        self.update_dashboard_info()
+
+    def _load_table(self, table_name):
+        """Re-fetches a table into its in-memory list only if it changed since the last load."""
+        attr = TABLE_ATTRIBUTES[table_name]
+        if self._dirty.get(table_name, True):
+            setattr(self, attr, self.db_manager.fetch_all_data(table_name))
+            self._dirty[table_name] = False
+        return getattr(self, attr)
+
+    def _set_combobox_values(self, combobox, source):
+        """Assigns a combobox's values (any iterable, e.g. the keys of an _index_by() dict) only when they differ from what it already shows."""
+        cached = self._combobox_values.get(combobox)
+        if cached is not None and cached[0] is source:
+            return cached[1] # Same index dict as last time; it is rebuilt, never mutated, when its table changes
+        values = tuple(source)
+        if cached is None or cached[1] != values:
+            combobox['values'] = values
+        self._combobox_values[combobox] = (source, values)
+        return values
+
+    def migrate_calendar_events_json(self):
+        """Moves events from the legacy calendar JSON file into the calendar_events table, once."""
+        if not os.path.exists(CALENDAR_EVENTS_FILE):
+            return
+        rows = []
+        for event in self.load_json_data(CALENDAR_EVENTS_FILE):
+            event_date = parse_date(event.get('date')) if isinstance(event, dict) else None
+            if event_date is None:
+                continue # Skip malformed entries
+            rows.append({"date": event_date, "description": event.get('description', ''), "type": event.get('type', 'General')})
+        if self.db_manager.insert_many("calendar_events", rows) is not False:
+            os.replace(CALENDAR_EVENTS_FILE, CALENDAR_EVENTS_FILE + ".migrated")
+
+    def _positions(self, table_name, rows):
+        """Returns {row id: position} for a table's in-memory list, rebuilt only after a reload or a delete."""
+        cached = self._row_positions.get(table_name)
+        if cached is None or cached[0] is not rows:
+            cached = (rows, {existing['id']: i for i, existing in enumerate(rows)})
+            self._row_positions[table_name] = cached
+        return cached[1]
+
+    def _apply_local_change(self, table_name, record_id, row=None):
+        """Mirrors a single-row insert/update (row) or delete (row=None) into a loaded table's list instead of re-fetching it."""
+        rows = getattr(self, TABLE_ATTRIBUTES[table_name])
+        positions = self._positions(table_name, rows)
+        position = positions.get(record_id)
+        if row is None:
+            if position is not None:
+                del rows[position]
+                del self._row_positions[table_name] # Later rows shifted; rebuilt on the next change
+        elif position is None:
+            positions[record_id] = len(rows)
+            rows.append(row)
+        else:
+            rows[position] = row
+        self._dirty[table_name] = False # Callers load the table before writing, so the patched list is current
+        for cache_key in [cache_key for cache_key in self._index_cache if cache_key[0] == table_name]:
+            del self._index_cache[cache_key]
+
+    def _index_by(self, table_name, *keys):
+        """Returns {row[key]: row} (or {(row[k1], row[k2], ...): row}) for a table's in-memory list, rebuilt only after the table changes."""
+        rows = self._load_table(table_name)
+        cached = self._index_cache.get((table_name, keys))
+        if cached is None or cached[0] is not rows:
+            row_key = itemgetter(*keys)
+            cached = (rows, {row_key(row): row for row in rows})
+            self._index_cache[(table_name, keys)] = cached
+        return cached[1]
+
+    def _group_by(self, table_name, key):
+        """Returns {row[key]: [rows...]} (in list order) for a table's in-memory list, rebuilt only after the table changes."""
+        rows = self._load_table(table_name)
+        cached = self._index_cache.get((table_name, key, list))
+        if cached is None or cached[0] is not rows:
+            groups = {}
+            for row in rows:
+                groups.setdefault(row[key], []).append(row)
+            cached = (rows, groups)
+            self._index_cache[(table_name, key, list)] = cached
+        return cached[1]
+
+    def _calendar_day_flags(self):
+        """Returns {date: EVENT_DAY | HOLIDAY_DAY | EXAM_DAY bits} for the loaded events, rebuilt only after they change."""
+        events_by_date = self._group_by("calendar_events", "date")
+        cached = self._day_flags
+        if cached is None or cached[0] is not events_by_date:
+            flags = {}
+            for event_date, events in events_by_date.items():
+                mask = EVENT_DAY
+                for event in events:
+                    mask |= DAY_TYPE_FLAGS.get(event['type'], 0)
+                flags[event_date] = mask
+            cached = self._day_flags = (events_by_date, flags)
+        return cached[1]
+
+    def _attendance_tally(self):
+        """Returns {student_id: [present, total]} for the loaded attendance list, recounting only after a full reload."""
+        rows = self._load_table("attendance")
+        cached = self._attendance_counts
+        if cached is None or cached[0] is not rows:
+            counts = {student_id: [present, total] for student_id, present, total in self.db_manager.fetch_attendance_summary()}
+            cached = self._attendance_counts = (rows, counts)
+        return cached[1]
+
+    def _count_attendance(self, counts, student_id, status, delta):
+        """Adds (delta=1) or removes (delta=-1) one record from an attendance tally."""
+        tally = counts.setdefault(student_id, [0, 0])
+        tally[0] += delta if status == 'Present' else 0
+        tally[1] += delta
+        if tally[1] <= 0:
+            del counts[student_id]
+
+    def _gpa_tally(self):
+        """Returns {student_id: [grade point sum, count]} for the loaded grades list, re-aggregating only after a full reload."""
+        rows = self._load_table("grades")
+        cached = self._gpa_totals
+        if cached is None or cached[0] is not rows:
+            totals = {student_id: [total_points, count] for student_id, total_points, count in self.db_manager.fetch_gpa_summary()}
+            cached = self._gpa_totals = (rows, totals)
+        return cached[1]
+
+    def _count_grade(self, totals, student_id, grade_point, delta):
+        """Adds (delta=1) or removes (delta=-1) one grade from a GPA tally."""
+        tally = totals.setdefault(student_id, [0.0, 0])
+        tally[0] += delta * grade_point
+        tally[1] += delta
+        if tally[1] <= 0:
+            del totals[student_id]
+
+    def _local_row(self, table_name, record_id):
+        """Returns the in-memory row with the given id, or None."""
+        rows = self._load_table(table_name)
+        position = self._positions(table_name, rows).get(record_id)
+        return None if position is None else rows[position]
+
+    def _patch_summary(self, key, tree, refresh, counts, student_ids, row_values):
+        """Rewrites only the given students' rows of a summary tree from their tallies.
+
+        A tree built from an older tally, or a row leaving (which would shift the stripes below it), falls back to a debounced full refresh.
+        """
+        if tree is None or key in self._pending:
+            return # Not built yet, or a full refresh is already on its way
+        if self._summary_sources.get(key) is not counts:
+            self._debounced(key, refresh)
+            return
+        students = self._index_by("students", "student_id")
+        for student_id in dict.fromkeys(student_ids):
+            tally = counts.get(student_id)
+            if tally is None:
+                if tree.exists(student_id):
+                    self._debounced(key, refresh)
+                    return
+            elif tree.exists(student_id):
+                tree.item(student_id, values=row_values(students, student_id, tally))
+            elif next(reversed(counts)) == student_id: # New students join the tally, and the tree, at the end
+                tree.insert("", "end", iid=student_id, values=row_values(students, student_id, tally), tags=ROW_TAGS[(len(counts) - 1) & 1])
+            else:
+                self._debounced(key, refresh)
+                return
+
+    def _write_json_rows(self, filepath, rows):
+        """Streams rows to a compact JSON array in fixed-size chunks, turning each sqlite3.Row into a dict only as it is written."""
+        # json.dump() always takes the pure-Python encoder; encode() on a slice runs the C one and bounds the text held at once
+        encode = json.JSONEncoder(separators=(',', ':'), default=dict).encode
+        with open(filepath, 'w', buffering=1 << 20, encoding='utf-8') as f:
+            f.write('[')
+            for start in range(0, len(rows), 2000):
+                if start:
+                    f.write(',')
+                f.write(encode(rows[start:start + 2000])[1:-1]) # Drop the chunk's own brackets
+            f.write(']')
+
+    def _export_json(self, filepath, table_name, done_message):
+        """Writes a table's rows to filepath off the Tk thread and reports the outcome once the file is written."""
+        rows = list(self._load_table(table_name)) # Snapshot; later edits replace list entries rather than mutate them
+        if self._io_executor is None:
+            try:
+                self._write_json_rows(filepath, rows)
+            except OSError as e:
+                messagebox.showerror("Export Error", f"Failed to export data: {e}", parent=self)
+                return
+            messagebox.showinfo("Export Complete", done_message, parent=self)
+            return
+        self.show_status(f"Exporting to {os.path.basename(filepath)}...")
+        future = self._io_executor.submit(self._write_json_rows, filepath, rows)
+        self.after(20, self._finish_export, future, done_message)
+
+    def _finish_export(self, future, done_message):
+        """Polls an export from the Tk thread (Tk must not be called from the worker) and shows its result."""
+        if not future.done():
+            self.after(20, self._finish_export, future, done_message)
+            return
+        error = future.exception()
+        if isinstance(error, OSError):
+            messagebox.showerror("Export Error", f"Failed to export data: {error}", parent=self)
+            return
+        if error is not None:
+            raise error
+        self.show_status("Export complete.")
+        messagebox.showinfo("Export Complete", done_message, parent=self)
+
     def load_json_data(self, filepath):
-        """Loads data from a JSON file (used for calendar events)."""
+        """Loads data from a JSON file (used for the calendar events migration)."""
         if os.path.exists(filepath):
             try:
                 with open(filepath, 'r') as f:
@@ -338,16 +1388,13 @@ class AcademicManagementApp(tk.Tk):
                 return []
         return []
 
-    def save_json_data(self, data, filepath):
-        """Saves data to a JSON file (used for calendar events)."""
-        try:
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=4)
-        except IOError as e:
-            messagebox.showerror("Save Error", f"Failed to save data to {filepath}: {e}", parent=self)
-
     def create_tabs(self):
         """Creates the main tabbed interface with left-side navigation."""
+        # Status bar for routine confirmations; packed first so the main container cannot squeeze it out
+        self.status_var = tk.StringVar(self)
+        tk.Label(self, textvariable=self.status_var, anchor="w", padx=10, font=('Arial', 9),
+                 bg=NORDIC_COLORS["bg_dark"], fg=NORDIC_COLORS["text_light"]).pack(side="bottom", fill="x")
+
         # Create main container frame
         self.main_container = ttk.Frame(self)
         self.main_container.pack(expand=1, fill="both", padx=0, pady=0)
@@ -416,7 +1463,14 @@ class AcademicManagementApp(tk.Tk):
             ("Analytics", self.init_analytics)
         ]
 
+        self._pending_inits = {} # Tab name -> init function of a tab that has not been shown yet
+
         def show_frame(name, button):
+            # Build the tab's widgets the first time it is shown; the refresh below then fills them once
+            init_func = self._pending_inits.pop(name, None)
+            if init_func:
+                init_func()
+
             # Hide current frame if it exists
             if self.current_frame:
                 self.current_frame.pack_forget()
@@ -435,34 +1489,34 @@ class AcademicManagementApp(tk.Tk):
             if name == "Dashboard":
                 self.update_dashboard_info()
             elif name == "Student Management":
-                self.students = self.db_manager.fetch_all_data("students")
-                self.refresh_student_display()
-                self.clear_student_entries()
+                self._load_table("students")
+                self._debounced("students", self.students_tab.refresh, immediate=True)
+                self.students_tab.clear()
             elif name == "Faculty Management":
-                self.faculty = self.db_manager.fetch_all_data("faculty")
-                self.refresh_faculty_display()
-                self.clear_faculty_entries()
+                self._load_table("faculty")
+                self.faculty_tab.refresh()
+                self.faculty_tab.clear()
             elif name == "Course Management":
-                self.courses = self.db_manager.fetch_all_data("courses")
-                self.refresh_course_display()
-                self.clear_course_entries()
+                self._load_table("courses")
+                self.courses_tab.refresh()
+                self.courses_tab.clear()
             elif name == "Routine Management":
-                self.schedules = self.db_manager.fetch_all_data("routines")
-                self.refresh_schedules_display()
+                self._load_table("routines")
+                self._debounced("routines", self.refresh_schedules_display, immediate=True)
                 self.cancel_schedule_edit()
             elif name == "Attendance Management":
-                self.attendance_records = self.db_manager.fetch_all_data("attendance")
-                self.refresh_attendance_display()
-                self.update_attendance_summary()
+                self._load_table("attendance")
+                self._debounced("attendance", self.refresh_attendance_display, immediate=True)
+                self._debounced("attendance_summary", self.update_attendance_summary, immediate=True)
                 self.cancel_attendance_edit()
             elif name == "Grading & Assessment":
-                self.grades = self.db_manager.fetch_all_data("grades")
-                self.refresh_grades_display()
-                self.update_gpa_summary()
+                self._load_table("grades")
+                self._debounced("grades", self.refresh_grades_display, immediate=True)
+                self._debounced("gpa_summary", self.update_gpa_summary, immediate=True)
                 self.cancel_grade_edit()
             elif name == "Academic Calendar":
-                if self.calendar_grid_frame and self.month_year_label and self.event_list_tree:
-                    self.draw_calendar()
+                if self.calendar_canvas and self.month_year_label and self.event_list_tree:
+                    self._debounced("calendar", self.draw_calendar, immediate=True)
 
         # Create navigation buttons and frames
         for name, init_func in nav_items:
@@ -476,8 +1530,8 @@ class AcademicManagementApp(tk.Tk):
             btn.pack(fill="x", padx=2, pady=1)
             self.nav_buttons[name] = btn
 
-            # Initialize the frame content
-            init_func()
+            # Defer the frame content until the tab is first shown
+            self._pending_inits[name] = init_func
 
         # Show dashboard by default
         show_frame("Dashboard", self.nav_buttons["Dashboard"])
@@ -525,58 +1579,49 @@ class AcademicManagementApp(tk.Tk):
             'upcoming_events': create_info_card(info_grid_frame, 1, 2, "Upcoming Calendar Events", "0")
         }
 
-        self.update_dashboard_info()
-
         # Add a "Clear All Data" button for development/testing
         ttk.Button(dashboard_frame, text="Clear All Local Data (DANGER!)", command=self.clear_all_data, style='Danger.TButton').pack(pady=30)
 
 
     def update_dashboard_info(self):
         """Updates the dynamic information on the Dashboard tab."""
-        self.students = self.db_manager.fetch_all_data("students")
-        self.faculty = self.db_manager.fetch_all_data("faculty")
-        self.courses = self.db_manager.fetch_all_data("courses")
-        self.attendance_records = self.db_manager.fetch_all_data("attendance")
-        self.grades = self.db_manager.fetch_all_data("grades")
-        self.calendar_events = self.load_json_data(CALENDAR_EVENTS_FILE)
-
-        self.dashboard_labels['students'].config(text=f"{len(self.students)}")
-        self.dashboard_labels['faculty'].config(text=f"{len(self.faculty)}")
-        self.dashboard_labels['courses'].config(text=f"{len(self.courses)}")
-        self.dashboard_labels['attendance_records'].config(text=f"{len(self.attendance_records)}")
-        self.dashboard_labels['grades_entered'].config(text=f"{len(self.grades)}")
-
-        # Count upcoming events (e.g., in the next 30 days)
-        today = datetime.now().date()
-        upcoming_count = 0
-        for event in self.calendar_events:
-            try:
-                event_date = datetime.strptime(event['date'], "%Y-%m-%d").date()
-                if today <= event_date <= today + timedelta(days=30):
-                    upcoming_count += 1
-            except ValueError:
-                # Handle malformed dates in calendar_events.json
-                pass
-        self.dashboard_labels['upcoming_events'].config(text=f"{upcoming_count}")
-
-        # Schedule next update
-        self.after(5000, self.update_dashboard_info)
+        # Only the row counts are shown, so fetch all six in a single query, and only if something changed
+        today = date.today()
+        shown = (self.db_manager.data_version(), today)
+        if shown == self._dashboard_shown:
+            return
+        self._dashboard_shown = shown
+        counts = self.db_manager.dashboard_counts(today.isoformat(), (today + timedelta(days=30)).isoformat())
+        for key, value in zip(('students', 'faculty', 'courses', 'attendance_records', 'grades_entered', 'upcoming_events'), counts):
+            self.dashboard_labels[key].config(text=f"{value}")
 
     def clear_all_data(self):
         """Clears all local data files and database tables."""
         if messagebox.askyesno("Confirm Clear All Data", "Are you absolutely sure you want to delete ALL local data (students, faculty, courses, schedules, attendance, grades, calendar events)? This action cannot be undone!", parent=self):
             try:
-                # Clear SQLite tables
-                cursor = self.db_manager.conn.cursor()
-                cursor.execute("DELETE FROM students")
-                cursor.execute("DELETE FROM faculty")
-                cursor.execute("DELETE FROM courses")
-                cursor.execute("DELETE FROM routines")
-                cursor.execute("DELETE FROM attendance")
-                cursor.execute("DELETE FROM grades")
-                self.db_manager.conn.commit()
-
-                # Clear JSON file
+                # Clear SQLite tables and reset their AUTOINCREMENT counters in one transaction
+                try:
+                    self.db_manager.conn.executescript("""
+                        BEGIN IMMEDIATE;
+                        DELETE FROM students;
+                        DELETE FROM faculty;
+                        DELETE FROM courses;
+                        DELETE FROM routines;
+                        DELETE FROM attendance;
+                        DELETE FROM grades;
+                        DELETE FROM calendar_events;
+                        DELETE FROM sqlite_sequence WHERE name IN
+                            ('students', 'faculty', 'courses', 'routines', 'attendance', 'grades', 'calendar_events');
+                        COMMIT;
+                    """)
+                except sqlite3.Error:
+                    if self.db_manager.conn.in_transaction:
+                        self.db_manager.conn.rollback()
+                    raise
+                finally:
+                    self.db_manager.invalidate() # Some DELETEs may have run before a failure
+
+                # Clear legacy JSON file
                 if os.path.exists(CALENDAR_EVENTS_FILE):
                     os.remove(CALENDAR_EVENTS_FILE)
 
@@ -592,187 +1637,90 @@ class AcademicManagementApp(tk.Tk):
                 messagebox.showinfo("Data Cleared", "All local data has been cleared.", parent=self)
                 # Refresh all displays
                 self.on_tab_change(None) # Simulate tab change to refresh all displays
-                self.update_dashboard_info()
+                self._schedule_dashboard()
             except Exception as e:
                 messagebox.showerror("Error", f"An error occurred while clearing data: {e}", parent=self)
 
     # --- Student Information Management Tab ---
     def init_student_management(self):
         """Initializes the Student Information Management tab."""
-        student_frame = ttk.Frame(self.frames["Student Management"], padding="20", style='TFrame')
-        student_frame.pack(expand=True, fill="both")
-
-        tk.Label(student_frame, text="Student Information Management", font=('Arial', 20, 'bold'),
-                 bg=NORDIC_COLORS["bg_light"], fg=NORDIC_COLORS["accent_dark_blue"]).pack(pady=15)
-
-        input_frame = tk.LabelFrame(student_frame, text="Add/Edit Student Profile", padx=15, pady=15,
-                                    bg=NORDIC_COLORS["bg_light"], fg=NORDIC_COLORS["text_dark"],
-                                    font=('Arial', 11, 'bold'), relief="solid", borderwidth=1)
-        input_frame.pack(pady=10, fill="x")
-
-        tk.Label(input_frame, text="Student ID:", bg=NORDIC_COLORS["bg_light"], fg=NORDIC_COLORS["text_dark"]).grid(row=0, column=0, padx=5, pady=5, sticky="w")
-        self.student_id_entry = ttk.Entry(input_frame, width=30)
-        self.student_id_entry.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
-
-        tk.Label(input_frame, text="Name:", bg=NORDIC_COLORS["bg_light"], fg=NORDIC_COLORS["text_dark"]).grid(row=1, column=0, padx=5, pady=5, sticky="w")
-        self.student_name_entry = ttk.Entry(input_frame, width=40)
-        self.student_name_entry.grid(row=1, column=1, padx=5, pady=5, sticky="ew")
-
-        tk.Label(input_frame, text="Major:", bg=NORDIC_COLORS["bg_light"], fg=NORDIC_COLORS["text_dark"]).grid(row=2, column=0, padx=5, pady=5, sticky="w")
-        self.student_major_entry = ttk.Entry(input_frame, width=30)
-        self.student_major_entry.grid(row=2, column=1, padx=5, pady=5, sticky="ew")
-
-        button_row_frame = ttk.Frame(input_frame, style='TFrame')
-        button_row_frame.grid(row=3, column=0, columnspan=2, pady=10)
-
-        self.add_student_button = ttk.Button(button_row_frame, text="Add Student", command=self.add_student, style='TButton')
-        self.add_student_button.pack(side="left", padx=5)
-        self.edit_student_button = ttk.Button(button_row_frame, text="Update Selected", command=self.edit_selected_student, state=tk.DISABLED, style='TButton')
-        self.edit_student_button.pack(side="left", padx=5)
-        self.cancel_student_edit_button = ttk.Button(button_row_frame, text="Cancel Edit", command=self.clear_student_entries, state=tk.DISABLED, style='TButton')
-        self.cancel_student_edit_button.pack(side="left", padx=5)
-
-        input_frame.grid_columnconfigure(1, weight=1)
-
-        # Student display
-        student_display_frame = tk.LabelFrame(student_frame, text="Registered Students", padx=15, pady=15,
-                                              bg=NORDIC_COLORS["bg_light"], fg=NORDIC_COLORS["text_dark"],
-                                              font=('Arial', 11, 'bold'), relief="solid", borderwidth=1)
-        student_display_frame.pack(pady=10, fill="both", expand=True)
-
-        self.student_tree = ttk.Treeview(student_display_frame, columns=("DB_ID", "StudentID", "Name", "Major"), show="headings")
-        self.student_tree.heading("DB_ID", text="DB ID")
-        self.student_tree.heading("StudentID", text="Student ID")
-        self.student_tree.heading("Name", text="Name")
-        self.student_tree.heading("Major", text="Major")
-        self.student_tree.column("DB_ID", width=50, anchor="center")
-        self.student_tree.column("StudentID", width=100, anchor="center")
-        self.student_tree.column("Name", width=200, anchor="w")
-        self.student_tree.column("Major", width=150, anchor="w")
-        self.student_tree.pack(side="left", fill="both", expand=True)
-
-        scrollbar = ttk.Scrollbar(student_display_frame, orient="vertical", command=self.student_tree.yview)
-        scrollbar.pack(side="right", fill="y")
-        self.student_tree.configure(yscrollcommand=scrollbar.set)
-
-        self.student_tree.bind("<Delete>", lambda event: self.delete_selected_student())
-        self.student_tree.bind("<<TreeviewSelect>>", self.on_student_select)
-
-        self.refresh_student_display()
-
-        # Bottom buttons
-        bottom_button_frame = ttk.Frame(student_frame, style='TFrame')
-        bottom_button_frame.pack(pady=10)
-        ttk.Button(bottom_button_frame, text="Delete Selected", command=self.delete_selected_student, style='Danger.TButton').pack(side="left", padx=5)
-        ttk.Button(bottom_button_frame, text="Import from Excel (xlsx/csv)", command=self.import_students_from_excel, style='TButton').pack(side="left", padx=5)
-        ttk.Button(bottom_button_frame, text="Export to Excel", command=self.export_students_to_excel, style='TButton').pack(side="left", padx=5)
-        ttk.Button(bottom_button_frame, text="Export to JSON", command=self.export_students_to_json, style='TButton').pack(side="left", padx=5)
-
-    def add_student(self):
-        student_id = self.student_id_entry.get().strip()
-        name = self.student_name_entry.get().strip()
-        major = self.student_major_entry.get().strip()
-
-        if not student_id or not name:
-            messagebox.showwarning("Input Error", "Student ID and Name are required.", parent=self)
-            return
-
-        data = {"student_id": student_id, "name": name, "major": major}
-        if self.db_manager.insert_data("students", data):
-            messagebox.showinfo("Success", f"Student '{name}' added successfully.", parent=self)
-            self.clear_student_entries()
-            self.students = self.db_manager.fetch_all_data("students")
-            self.refresh_student_display()
-            self.update_dashboard_info()
-
-    def edit_selected_student(self):
-        if not self.selected_student_id:
-            messagebox.showwarning("No Selection", "Please select a student to update.", parent=self)
+        self.students_tab = CrudTab(self, "Student Management", "students", STUDENT_COLUMNS,
+                                    title="Student Information Management", form_title="Add/Edit Student Profile",
+                                    list_title="Registered Students", item_label="Student", noun="student",
+                                    buttons=(("Import from Excel (xlsx/csv)", self.import_students_from_excel),
+                                             ("Export to Excel", self.export_students_to_excel),
+                                             ("Export to JSON", self.export_students_to_json)))
+
+    def iter_spreadsheet_rows(self, filepath):
+        """Yields the rows of a .csv or .xlsx file one at a time, header row first, without loading the whole sheet."""
+        if filepath.lower().endswith(".csv"):
+            with open(filepath, newline='', encoding='utf-8-sig') as f:
+                yield from csv.reader(f)
             return
+        try:
+            import openpyxl # Optional dependency, only needed for Excel files
+        except ImportError:
+            raise ValueError("Reading Excel files requires the 'openpyxl' package. Install it or save the sheet as CSV.")
+        workbook = openpyxl.load_workbook(filepath, read_only=True, data_only=True)
+        try:
+            yield from workbook.active.iter_rows(values_only=True)
+        finally:
+            workbook.close()
 
-        student_id = self.student_id_entry.get().strip()
-        name = self.student_name_entry.get().strip()
-        major = self.student_major_entry.get().strip()
-
-        if not student_id or not name:
-            messagebox.showwarning("Input Error", "Student ID and Name are required.", parent=self)
+    def import_students_from_excel(self):
+        """Bulk-imports students from a .csv or .xlsx file with Student ID, Name and Major columns."""
+        filepath = filedialog.askopenfilename(filetypes=[("Excel/CSV files", "*.xlsx *.csv"), ("Excel files", "*.xlsx"), ("CSV files", "*.csv")], parent=self)
+        if not filepath:
             return
+        sheet = self.iter_spreadsheet_rows(filepath)
+        try:
+            try:
+                first_row = next(sheet, None)
+            except (OSError, ValueError, csv.Error) as e:
+                messagebox.showerror("Import Error", f"Failed to read {filepath}: {e}", parent=self)
+                return
+            if first_row is None:
+                messagebox.showwarning("Import Error", "The selected file is empty.", parent=self)
+                return
 
-        data = {"student_id": student_id, "name": name, "major": major}
-        if self.db_manager.update_data("students", self.selected_student_id, data):
-            messagebox.showinfo("Success", f"Student '{name}' updated successfully.", parent=self)
-            self.clear_student_entries()
-            self.students = self.db_manager.fetch_all_data("students")
-            self.refresh_student_display()
-            self.update_dashboard_info()
-        else:
-            messagebox.showerror("Update Failed", "Could not update student. Check for duplicate Student ID.", parent=self)
-
-    def delete_selected_student(self):
-        selected_items = self.student_tree.selection()
-        if not selected_items:
-            messagebox.showwarning("No Selection", "Please select a student to delete.", parent=self)
+            # Map header cells such as "Student ID" / "student_id" onto the table columns
+            header = [str(cell or "").strip().lower().replace(" ", "_") for cell in first_row]
+            if "student_id" not in header or "name" not in header:
+                messagebox.showerror("Import Error", "The first row must contain 'Student ID' and 'Name' column headers (and optionally 'Major').", parent=self)
+                return
+            id_col, name_col = header.index("student_id"), header.index("name")
+            major_col = header.index("major") if "major" in header else None
+
+            def cell(row, col):
+                value = row[col] if col is not None and col < len(row) else None
+                return "" if value is None else str(value).strip()
+
+            skipped = 0
+            def student_rows():
+                nonlocal skipped
+                for row in sheet:
+                    student_id, name = cell(row, id_col), cell(row, name_col)
+                    if not student_id or not name:
+                        skipped += 1 # Student ID and Name are required, as in the form
+                        continue
+                    yield (student_id, name, cell(row, major_col))
+
+            # Rows stream from the file straight into batched multi-row INSERTs
+            try:
+                inserted = self.db_manager.bulk_insert("students", ("student_id", "name", "major"), student_rows(), rebuild_indexes=True)
+            except (OSError, ValueError, csv.Error) as e:
+                messagebox.showerror("Import Error", f"Failed to read {filepath}: {e}. Nothing was imported.", parent=self)
+                return
+        finally:
+            sheet.close()
+        if inserted is False:
             return
-
-        db_id_to_delete = self.student_tree.item(selected_items[0], 'values')[0]
-        student_name = self.student_tree.item(selected_items[0], 'values')[2]
-
-        if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete student '{student_name}'?", parent=self):
-            if self.db_manager.delete_data("students", db_id_to_delete):
-                messagebox.showinfo("Success", f"Student '{student_name}' deleted successfully.", parent=self)
-                self.clear_student_entries()
-                self.students = self.db_manager.fetch_all_data("students")
-                self.refresh_student_display()
-                self.update_dashboard_info()
-            else:
-                messagebox.showerror("Delete Failed", "Could not delete student.", parent=self)
-
-    def refresh_student_display(self):
-        if self.student_tree is None: return
-        for item in self.student_tree.get_children():
-            self.student_tree.delete(item)
-        # Configure alternating row colors for this Treeview
-        self.student_tree.tag_configure('oddrow', background=NORDIC_COLORS["treeview_row_bg1"])
-        self.student_tree.tag_configure('evenrow', background=NORDIC_COLORS["treeview_row_bg2"])
-        for i, student in enumerate(self.students):
-            tag = 'evenrow' if i % 2 == 0 else 'oddrow'
-            self.student_tree.insert("", "end", iid=student['id'], values=(student['id'], student['student_id'], student['name'], student['major']), tags=(tag,))
-
-    def on_student_select(self, event):
-        selected_items = self.student_tree.selection()
-        if selected_items:
-            values = self.student_tree.item(selected_items[0], 'values')
-            self.selected_student_id = values[0] # Store DB ID
-            self.student_id_entry.delete(0, tk.END)
-            self.student_id_entry.insert(0, values[1])
-            self.student_name_entry.delete(0, tk.END)
-            self.student_name_entry.insert(0, values[2])
-            self.student_major_entry.delete(0, tk.END)
-            self.student_major_entry.insert(0, values[3])
-            self.add_student_button.config(state=tk.DISABLED)
-            self.edit_student_button.config(state=tk.NORMAL)
-            self.cancel_student_edit_button.config(state=tk.NORMAL)
-        else:
-            self.clear_student_entries()
-
-    def clear_student_entries(self):
-        self.selected_student_id = None
-        self.student_id_entry.delete(0, tk.END)
-        self.student_name_entry.delete(0, tk.END)
-        self.student_major_entry.delete(0, tk.END)
-        self.add_student_button.config(state=tk.NORMAL)
-        self.edit_student_button.config(state=tk.DISABLED)
-        self.cancel_student_edit_button.config(state=tk.DISABLED)
-        if self.student_tree:
-            self.student_tree.selection_remove(self.student_tree.selection())
-
-    def import_students_from_excel(self):
-        messagebox.showinfo("Import Feature", "This feature would allow importing student data from .xlsx or .csv files with field mapping. (Not implemented in this demo)", parent=self)
-        # Placeholder for actual implementation:
-        # filepath = filedialog.askopenfilename(filetypes=[("Excel files", "*.xlsx *.xls"), ("CSV files", "*.csv")])
-        # if filepath:
-        #     # Implement pandas/openpyxl logic here to read and insert into DB
-        #     pass
+        self._load_table("students")
+        self._debounced("students", self.students_tab.refresh)
+        message = f"Imported {inserted} student(s) from {os.path.basename(filepath)}."
+        if skipped:
+            message += f" Skipped {skipped} row(s) without a Student ID or Name."
+        messagebox.showinfo("Import Complete", message, parent=self)
 
     def export_students_to_excel(self):
         messagebox.showinfo("Export Feature", "This feature would export student data to an Excel (.xlsx) file. (Not implemented in this demo)", parent=self)
@@ -787,424 +1735,35 @@ class AcademicManagementApp(tk.Tk):
                                                 filetypes=[("JSON files", "*.json")],
                                                 title="Export Students to JSON", parent=self)
         if filepath:
-            try:
-                # Convert list of Row objects to list of dicts for JSON export
-                students_data = [dict(s) for s in self.students]
-                with open(filepath, 'w') as f:
-                    json.dump(students_data, f, indent=4)
-                messagebox.showinfo("Export Complete", f"Student data exported to {filepath}", parent=self)
-            except IOError as e:
-                messagebox.showerror("Export Error", f"Failed to export data: {e}", parent=self)
+            self._export_json(filepath, "students", f"Student data exported to {filepath}")
 
     # --- Faculty Information Management Tab ---
     def init_faculty_management(self):
-        faculty_frame = ttk.Frame(self.frames["Faculty Management"], padding="20", style='TFrame')
-        faculty_frame.pack(expand=True, fill="both")
-
-        tk.Label(faculty_frame, text="Faculty Information Management", font=('Arial', 20, 'bold'),
-                 bg=NORDIC_COLORS["bg_light"], fg=NORDIC_COLORS["accent_dark_blue"]).pack(pady=15)
-
-        input_frame = tk.LabelFrame(faculty_frame, text="Add/Edit Faculty Profile", padx=15, pady=15,
-                                    bg=NORDIC_COLORS["bg_light"], fg=NORDIC_COLORS["text_dark"],
-                                    font=('Arial', 11, 'bold'), relief="solid", borderwidth=1)
-        input_frame.pack(pady=10, fill="x")
-
-        tk.Label(input_frame, text="Faculty ID:", bg=NORDIC_COLORS["bg_light"], fg=NORDIC_COLORS["text_dark"]).grid(row=0, column=0, padx=5, pady=5, sticky="w")
-        self.faculty_id_entry = ttk.Entry(input_frame, width=30)
-        self.faculty_id_entry.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
-
-        tk.Label(input_frame, text="Name:", bg=NORDIC_COLORS["bg_light"], fg=NORDIC_COLORS["text_dark"]).grid(row=1, column=0, padx=5, pady=5, sticky="w")
-        self.faculty_name_entry = ttk.Entry(input_frame, width=40)
-        self.faculty_name_entry.grid(row=1, column=1, padx=5, pady=5, sticky="ew")
-
-        tk.Label(input_frame, text="Department:", bg=NORDIC_COLORS["bg_light"], fg=NORDIC_COLORS["text_dark"]).grid(row=2, column=0, padx=5, pady=5, sticky="w")
-        self.faculty_dept_entry = ttk.Entry(input_frame, width=30)
-        self.faculty_dept_entry.grid(row=2, column=1, padx=5, pady=5, sticky="ew")
-
-        tk.Label(input_frame, text="Rank:", bg=NORDIC_COLORS["bg_light"], fg=NORDIC_COLORS["text_dark"]).grid(row=3, column=0, padx=5, pady=5, sticky="w")
-        self.faculty_rank_entry = ttk.Entry(input_frame, width=30)
-        self.faculty_rank_entry.grid(row=3, column=1, padx=5, pady=5, sticky="ew")
-
-        tk.Label(input_frame, text="Contact Info:", bg=NORDIC_COLORS["bg_light"], fg=NORDIC_COLORS["text_dark"]).grid(row=4, column=0, padx=5, pady=5, sticky="w")
-        self.faculty_contact_entry = ttk.Entry(input_frame, width=40)
-        self.faculty_contact_entry.grid(row=4, column=1, padx=5, pady=5, sticky="ew")
-
-        button_row_frame = ttk.Frame(input_frame, style='TFrame')
-        button_row_frame.grid(row=5, column=0, columnspan=2, pady=10)
-
-        self.add_faculty_button = ttk.Button(button_row_frame, text="Add Faculty", command=self.add_faculty, style='TButton')
-        self.add_faculty_button.pack(side="left", padx=5)
-        self.edit_faculty_button = ttk.Button(button_row_frame, text="Update Selected", command=self.edit_selected_faculty, state=tk.DISABLED, style='TButton')
-        self.edit_faculty_button.pack(side="left", padx=5)
-        self.cancel_faculty_edit_button = ttk.Button(button_row_frame, text="Cancel Edit", command=self.clear_faculty_entries, state=tk.DISABLED, style='TButton')
-        self.cancel_faculty_edit_button.pack(side="left", padx=5)
-
-        input_frame.grid_columnconfigure(1, weight=1)
-
-        faculty_display_frame = tk.LabelFrame(faculty_frame, text="Registered Faculty", padx=15, pady=15,
-                                              bg=NORDIC_COLORS["bg_light"], fg=NORDIC_COLORS["text_dark"],
-                                              font=('Arial', 11, 'bold'), relief="solid", borderwidth=1)
-        faculty_display_frame.pack(pady=10, fill="both", expand=True)
-
-        self.faculty_tree = ttk.Treeview(faculty_display_frame, columns=("DB_ID", "FacultyID", "Name", "Department", "Rank", "Contact"), show="headings")
-        self.faculty_tree.heading("DB_ID", text="DB ID")
-        self.faculty_tree.heading("FacultyID", text="Faculty ID")
-        self.faculty_tree.heading("Name", text="Name")
-        self.faculty_tree.heading("Department", text="Department")
-        self.faculty_tree.heading("Rank", text="Rank")
-        self.faculty_tree.heading("Contact", text="Contact Info")
-        self.faculty_tree.column("DB_ID", width=50, anchor="center")
-        self.faculty_tree.column("FacultyID", width=100, anchor="center")
-        self.faculty_tree.column("Name", width=150, anchor="w")
-        self.faculty_tree.column("Department", width=100, anchor="w")
-        self.faculty_tree.column("Rank", width=80, anchor="w")
-        self.faculty_tree.column("Contact", width=150, anchor="w")
-        self.faculty_tree.pack(side="left", fill="both", expand=True)
-
-        scrollbar = ttk.Scrollbar(faculty_display_frame, orient="vertical", command=self.faculty_tree.yview)
-        scrollbar.pack(side="right", fill="y")
-        self.faculty_tree.configure(yscrollcommand=scrollbar.set)
-
-        self.faculty_tree.bind("<Delete>", lambda event: self.delete_selected_faculty())
-        self.faculty_tree.bind("<<TreeviewSelect>>", self.on_faculty_select)
-
-        self.refresh_faculty_display()
-
-        bottom_button_frame = ttk.Frame(faculty_frame, style='TFrame')
-        bottom_button_frame.pack(pady=10)
-        ttk.Button(bottom_button_frame, text="Delete Selected", command=self.delete_selected_faculty, style='Danger.TButton').pack(side="left", padx=5)
-        ttk.Button(bottom_button_frame, text="Export to JSON", command=self.export_faculty_to_json, style='TButton').pack(side="left", padx=5)
-
-    def add_faculty(self):
-        faculty_id = self.faculty_id_entry.get().strip()
-        name = self.faculty_name_entry.get().strip()
-        department = self.faculty_dept_entry.get().strip()
-        rank = self.faculty_rank_entry.get().strip()
-        contact = self.faculty_contact_entry.get().strip()
-
-        if not faculty_id or not name:
-            messagebox.showwarning("Input Error", "Faculty ID and Name are required.", parent=self)
-            return
-
-        data = {"faculty_id": faculty_id, "name": name, "department": department, "rank": rank, "contact_info": contact}
-        if self.db_manager.insert_data("faculty", data):
-            messagebox.showinfo("Success", f"Faculty '{name}' added successfully.", parent=self)
-            self.clear_faculty_entries()
-            self.faculty = self.db_manager.fetch_all_data("faculty")
-            self.refresh_faculty_display()
-            self.update_dashboard_info()
-
-    def edit_selected_faculty(self):
-        if not self.selected_faculty_id:
-            messagebox.showwarning("No Selection", "Please select a faculty member to update.", parent=self)
-            return
-
-        faculty_id = self.faculty_id_entry.get().strip()
-        name = self.faculty_name_entry.get().strip()
-        department = self.faculty_dept_entry.get().strip()
-        rank = self.faculty_rank_entry.get().strip()
-        contact = self.faculty_contact_entry.get().strip()
-
-        if not faculty_id or not name:
-            messagebox.showwarning("Input Error", "Faculty ID and Name are required.", parent=self)
-            return
-
-        data = {"faculty_id": faculty_id, "name": name, "department": department, "rank": rank, "contact_info": contact}
-        if self.db_manager.update_data("faculty", self.selected_faculty_id, data):
-            messagebox.showinfo("Success", f"Faculty '{name}' updated successfully.", parent=self)
-            self.clear_faculty_entries()
-            self.faculty = self.db_manager.fetch_all_data("faculty")
-            self.refresh_faculty_display()
-            self.update_dashboard_info()
-        else:
-            messagebox.showerror("Update Failed", "Could not update faculty. Check for duplicate Faculty ID.", parent=self)
-
-    def delete_selected_faculty(self):
-        selected_items = self.faculty_tree.selection()
-        if not selected_items:
-            messagebox.showwarning("No Selection", "Please select a faculty member to delete.", parent=self)
-            return
-
-        db_id_to_delete = self.faculty_tree.item(selected_items[0], 'values')[0]
-        faculty_name = self.faculty_tree.item(selected_items[0], 'values')[2]
-
-        if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete faculty member '{faculty_name}'?", parent=self):
-            if self.db_manager.delete_data("faculty", db_id_to_delete):
-                messagebox.showinfo("Success", f"Faculty '{faculty_name}' deleted successfully.", parent=self)
-                self.clear_faculty_entries()
-                self.faculty = self.db_manager.fetch_all_data("faculty")
-                self.refresh_faculty_display()
-                self.update_dashboard_info()
-            else:
-                messagebox.showerror("Delete Failed", "Could not delete faculty member.", parent=self)
-
-    def refresh_faculty_display(self):
-        if self.faculty_tree is None: return
-        for item in self.faculty_tree.get_children():
-            self.faculty_tree.delete(item)
-        # Configure alternating row colors for this Treeview
-        self.faculty_tree.tag_configure('oddrow', background=NORDIC_COLORS["treeview_row_bg1"])
-        self.faculty_tree.tag_configure('evenrow', background=NORDIC_COLORS["treeview_row_bg2"])
-        for i, f in enumerate(self.faculty):
-            tag = 'evenrow' if i % 2 == 0 else 'oddrow'
-            self.faculty_tree.insert("", "end", iid=f['id'], values=(f['id'], f['faculty_id'], f['name'], f['department'], f['rank'], f['contact_info']), tags=(tag,))
-
-    def on_faculty_select(self, event):
-        selected_items = self.faculty_tree.selection()
-        if selected_items:
-            values = self.faculty_tree.item(selected_items[0], 'values')
-            self.selected_faculty_id = values[0] # Store DB ID
-            self.faculty_id_entry.delete(0, tk.END)
-            self.faculty_id_entry.insert(0, values[1])
-            self.faculty_name_entry.delete(0, tk.END)
-            self.faculty_name_entry.insert(0, values[2])
-            self.faculty_dept_entry.delete(0, tk.END)
-            self.faculty_dept_entry.insert(0, values[3])
-            self.faculty_rank_entry.delete(0, tk.END)
-            self.faculty_rank_entry.insert(0, values[4])
-            self.faculty_contact_entry.delete(0, tk.END)
-            self.faculty_contact_entry.insert(0, values[5])
-            self.add_faculty_button.config(state=tk.DISABLED)
-            self.edit_faculty_button.config(state=tk.NORMAL)
-            self.cancel_faculty_edit_button.config(state=tk.NORMAL)
-        else:
-            self.clear_faculty_entries()
-
-    def clear_faculty_entries(self):
-        self.selected_faculty_id = None
-        self.faculty_id_entry.delete(0, tk.END)
-        self.faculty_name_entry.delete(0, tk.END)
-        self.faculty_dept_entry.delete(0, tk.END)
-        self.faculty_rank_entry.delete(0, tk.END)
-        self.faculty_contact_entry.delete(0, tk.END)
-        self.add_faculty_button.config(state=tk.NORMAL)
-        self.edit_faculty_button.config(state=tk.DISABLED)
-        self.cancel_faculty_edit_button.config(state=tk.DISABLED)
-        if self.faculty_tree:
-            self.faculty_tree.selection_remove(self.faculty_tree.selection())
+        self.faculty_tab = CrudTab(self, "Faculty Management", "faculty", FACULTY_COLUMNS,
+                                   title="Faculty Information Management", form_title="Add/Edit Faculty Profile",
+                                   list_title="Registered Faculty", item_label="Faculty", noun="faculty member",
+                                   buttons=(("Export to JSON", self.export_faculty_to_json),))
 
     def export_faculty_to_json(self):
         filepath = filedialog.asksaveasfilename(defaultextension=".json",
                                                 filetypes=[("JSON files", "*.json")],
                                                 title="Export Faculty to JSON", parent=self)
         if filepath:
-            try:
-                faculty_data = [dict(f) for f in self.faculty]
-                with open(filepath, 'w') as f:
-                    json.dump(faculty_data, f, indent=4)
-                messagebox.showinfo("Export Complete", f"Faculty data exported to {filepath}", parent=self)
-            except IOError as e:
-                messagebox.showerror("Export Error", f"Failed to export data: {e}", parent=self)
+            self._export_json(filepath, "faculty", f"Faculty data exported to {filepath}")
 
     # --- Course & Curriculum Management Tab ---
     def init_course_management(self):
-        course_frame = ttk.Frame(self.frames["Course Management"], padding="20", style='TFrame')
-        course_frame.pack(expand=True, fill="both")
-
-        tk.Label(course_frame, text="Course & Curriculum Management", font=('Arial', 20, 'bold'),
-                 bg=NORDIC_COLORS["bg_light"], fg=NORDIC_COLORS["accent_dark_blue"]).pack(pady=15)
-
-        input_frame = tk.LabelFrame(course_frame, text="Add/Edit Course", padx=15, pady=15,
-                                    bg=NORDIC_COLORS["bg_light"], fg=NORDIC_COLORS["text_dark"],
-                                    font=('Arial', 11, 'bold'), relief="solid", borderwidth=1)
-        input_frame.pack(pady=10, fill="x")
-
-        tk.Label(input_frame, text="Course Code:", bg=NORDIC_COLORS["bg_light"], fg=NORDIC_COLORS["text_dark"]).grid(row=0, column=0, padx=5, pady=5, sticky="w")
-        self.course_code_entry = ttk.Entry(input_frame, width=30)
-        self.course_code_entry.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
-
-        tk.Label(input_frame, text="Course Name:", bg=NORDIC_COLORS["bg_light"], fg=NORDIC_COLORS["text_dark"]).grid(row=1, column=0, padx=5, pady=5, sticky="w")
-        self.course_name_entry = ttk.Entry(input_frame, width=40)
-        self.course_name_entry.grid(row=1, column=1, padx=5, pady=5, sticky="ew")
-
-        tk.Label(input_frame, text="Program:", bg=NORDIC_COLORS["bg_light"], fg=NORDIC_COLORS["text_dark"]).grid(row=2, column=0, padx=5, pady=5, sticky="w")
-        self.course_program_entry = ttk.Entry(input_frame, width=30)
-        self.course_program_entry.grid(row=2, column=1, padx=5, pady=5, sticky="ew")
-
-        tk.Label(input_frame, text="Credits:", bg=NORDIC_COLORS["bg_light"], fg=NORDIC_COLORS["text_dark"]).grid(row=3, column=0, padx=5, pady=5, sticky="w")
-        self.course_credits_entry = ttk.Entry(input_frame, width=10)
-        self.course_credits_entry.grid(row=3, column=1, padx=5, pady=5, sticky="ew")
-
-        tk.Label(input_frame, text="Prerequisites:", bg=NORDIC_COLORS["bg_light"], fg=NORDIC_COLORS["text_dark"]).grid(row=4, column=0, padx=5, pady=5, sticky="w")
-        self.course_prereq_entry = ttk.Entry(input_frame, width=40)
-        self.course_prereq_entry.grid(row=4, column=1, padx=5, pady=5, sticky="ew")
-
-        button_row_frame = ttk.Frame(input_frame, style='TFrame')
-        button_row_frame.grid(row=5, column=0, columnspan=2, pady=10)
-
-        self.add_course_button = ttk.Button(button_row_frame, text="Add Course", command=self.add_course, style='TButton')
-        self.add_course_button.pack(side="left", padx=5)
-        self.edit_course_button = ttk.Button(button_row_frame, text="Update Selected", command=self.edit_selected_course, state=tk.DISABLED, style='TButton')
-        self.edit_course_button.pack(side="left", padx=5)
-        self.cancel_course_edit_button = ttk.Button(button_row_frame, text="Cancel Edit", command=self.clear_course_entries, state=tk.DISABLED, style='TButton')
-        self.cancel_course_edit_button.pack(side="left", padx=5)
-
-        input_frame.grid_columnconfigure(1, weight=1)
-
-        course_display_frame = tk.LabelFrame(course_frame, text="Registered Courses", padx=15, pady=15,
-                                             bg=NORDIC_COLORS["bg_light"], fg=NORDIC_COLORS["text_dark"],
-                                             font=('Arial', 11, 'bold'), relief="solid", borderwidth=1)
-        course_display_frame.pack(pady=10, fill="both", expand=True)
-
-        self.course_tree = ttk.Treeview(course_display_frame, columns=("DB_ID", "CourseCode", "CourseName", "Program", "Credits", "Prerequisites"), show="headings")
-        self.course_tree.heading("DB_ID", text="DB ID")
-        self.course_tree.heading("CourseCode", text="Code")
-        self.course_tree.heading("CourseName", text="Name")
-        self.course_tree.heading("Program", text="Program")
-        self.course_tree.heading("Credits", text="Credits")
-        self.course_tree.heading("Prerequisites", text="Prerequisites")
-        self.course_tree.column("DB_ID", width=50, anchor="center")
-        self.course_tree.column("CourseCode", width=80, anchor="center")
-        self.course_tree.column("CourseName", width=200, anchor="w")
-        self.course_tree.column("Program", width=100, anchor="w")
-        self.course_tree.column("Credits", width=60, anchor="center")
-        self.course_tree.column("Prerequisites", width=150, anchor="w")
-        self.course_tree.pack(side="left", fill="both", expand=True)
-
-        scrollbar = ttk.Scrollbar(course_display_frame, orient="vertical", command=self.course_tree.yview)
-        scrollbar.pack(side="right", fill="y")
-        self.course_tree.configure(yscrollcommand=scrollbar.set)
-
-        self.course_tree.bind("<Delete>", lambda event: self.delete_selected_course())
-        self.course_tree.bind("<<TreeviewSelect>>", self.on_course_select)
-
-        self.refresh_course_display()
-
-        bottom_button_frame = ttk.Frame(course_frame, style='TFrame')
-        bottom_button_frame.pack(pady=10)
-        ttk.Button(bottom_button_frame, text="Delete Selected", command=self.delete_selected_course, style='Danger.TButton').pack(side="left", padx=5)
-        ttk.Button(bottom_button_frame, text="Export to JSON", command=self.export_courses_to_json, style='TButton').pack(side="left", padx=5)
-
-    def add_course(self):
-        course_code = self.course_code_entry.get().strip()
-        course_name = self.course_name_entry.get().strip()
-        program = self.course_program_entry.get().strip()
-        credits_str = self.course_credits_entry.get().strip()
-        prerequisites = self.course_prereq_entry.get().strip()
-
-        if not course_code or not course_name:
-            messagebox.showwarning("Input Error", "Course Code and Course Name are required.", parent=self)
-            return
-        try:
-            credits = float(credits_str)
-        except ValueError:
-            messagebox.showwarning("Input Error", "Credits must be a number.", parent=self)
-            return
-
-        data = {"course_code": course_code, "course_name": course_name, "program": program, "credits": credits, "prerequisites": prerequisites}
-        if self.db_manager.insert_data("courses", data):
-            messagebox.showinfo("Success", f"Course '{course_name}' added successfully.", parent=self)
-            self.clear_course_entries()
-            self.courses = self.db_manager.fetch_all_data("courses")
-            self.refresh_course_display()
-            self.update_dashboard_info()
-
-    def edit_selected_course(self):
-        if not self.selected_course_id:
-            messagebox.showwarning("No Selection", "Please select a course to update.", parent=self)
-            return
-
-        course_code = self.course_code_entry.get().strip()
-        course_name = self.course_name_entry.get().strip()
-        program = self.course_program_entry.get().strip()
-        credits_str = self.course_credits_entry.get().strip()
-        prerequisites = self.course_prereq_entry.get().strip()
-
-        if not course_code or not course_name:
-            messagebox.showwarning("Input Error", "Course Code and Course Name are required.", parent=self)
-            return
-        try:
-            credits = float(credits_str)
-        except ValueError:
-            messagebox.showwarning("Input Error", "Credits must be a number.", parent=self)
-            return
-
-        data = {"course_code": course_code, "course_name": course_name, "program": program, "credits": credits, "prerequisites": prerequisites}
-        if self.db_manager.update_data("courses", self.selected_course_id, data):
-            messagebox.showinfo("Success", f"Course '{course_name}' updated successfully.", parent=self)
-            self.clear_course_entries()
-            self.courses = self.db_manager.fetch_all_data("courses")
-            self.refresh_course_display()
-            self.update_dashboard_info()
-        else:
-            messagebox.showerror("Update Failed", "Could not update course. Check for duplicate Course Code.", parent=self)
-
-    def delete_selected_course(self):
-        selected_items = self.course_tree.selection()
-        if not selected_items:
-            messagebox.showwarning("No Selection", "Please select a course to delete.", parent=self)
-            return
-
-        db_id_to_delete = self.course_tree.item(selected_items[0], 'values')[0]
-        course_name = self.course_tree.item(selected_items[0], 'values')[2]
-
-        if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete course '{course_name}'?", parent=self):
-            if self.db_manager.delete_data("courses", db_id_to_delete):
-                messagebox.showinfo("Success", f"Course '{course_name}' deleted successfully.", parent=self)
-                self.clear_course_entries()
-                self.courses = self.db_manager.fetch_all_data("courses")
-                self.refresh_course_display()
-                self.update_dashboard_info()
-            else:
-                messagebox.showerror("Delete Failed", "Could not delete course.", parent=self)
-
-    def refresh_course_display(self):
-        if self.course_tree is None: return
-        for item in self.course_tree.get_children():
-            self.course_tree.delete(item)
-        # Configure alternating row colors for this Treeview
-        self.course_tree.tag_configure('oddrow', background=NORDIC_COLORS["treeview_row_bg1"])
-        self.course_tree.tag_configure('evenrow', background=NORDIC_COLORS["treeview_row_bg2"])
-        for i, c in enumerate(self.courses):
-            tag = 'evenrow' if i % 2 == 0 else 'oddrow'
-            self.course_tree.insert("", "end", iid=c['id'], values=(c['id'], c['course_code'], c['course_name'], c['program'], c['credits'], c['prerequisites']), tags=(tag,))
-
-    def on_course_select(self, event):
-        selected_items = self.course_tree.selection()
-        if selected_items:
-            values = self.course_tree.item(selected_items[0], 'values')
-            self.selected_course_id = values[0] # Store DB ID
-            self.course_code_entry.delete(0, tk.END)
-            self.course_code_entry.insert(0, values[1])
-            self.course_name_entry.delete(0, tk.END)
-            self.course_name_entry.insert(0, values[2])
-            self.course_program_entry.delete(0, tk.END)
-            self.course_program_entry.insert(0, values[3])
-            self.course_credits_entry.delete(0, tk.END)
-            self.course_credits_entry.insert(0, str(values[4]))
-            self.course_prereq_entry.delete(0, tk.END)
-            self.course_prereq_entry.insert(0, values[5])
-            self.add_course_button.config(state=tk.DISABLED)
-            self.edit_course_button.config(state=tk.NORMAL)
-            self.cancel_course_edit_button.config(state=tk.NORMAL)
-        else:
-            self.clear_course_entries()
-
-    def clear_course_entries(self):
-        self.selected_course_id = None
-        self.course_code_entry.delete(0, tk.END)
-        self.course_name_entry.delete(0, tk.END)
-        self.course_program_entry.delete(0, tk.END)
-        self.course_credits_entry.delete(0, tk.END)
-        self.course_prereq_entry.delete(0, tk.END)
-        self.add_course_button.config(state=tk.NORMAL)
-        self.edit_course_button.config(state=tk.DISABLED)
-        self.cancel_course_edit_button.config(state=tk.DISABLED)
-        if self.course_tree:
-            self.course_tree.selection_remove(self.course_tree.selection())
+        self.courses_tab = CrudTab(self, "Course Management", "courses", COURSE_COLUMNS,
+                                   title="Course & Curriculum Management", form_title="Add/Edit Course",
+                                   list_title="Registered Courses", item_label="Course", noun="course",
+                                   buttons=(("Export to JSON", self.export_courses_to_json),))
 
     def export_courses_to_json(self):
         filepath = filedialog.asksaveasfilename(defaultextension=".json",
                                                 filetypes=[("JSON files", "*.json")],
                                                 title="Export Courses to JSON", parent=self)
         if filepath:
-            try:
-                courses_data = [dict(c) for c in self.courses]
-                with open(filepath, 'w') as f:
-                    json.dump(courses_data, f, indent=4)
-                messagebox.showinfo("Export Complete", f"Course data exported to {filepath}", parent=self)
-            except IOError as e:
-                messagebox.showerror("Export Error", f"Failed to export data: {e}", parent=self)
+            self._export_json(filepath, "courses", f"Course data exported to {filepath}")
 
     # --- Routine Management Tab ---
     def init_scheduling(self):
@@ -1225,11 +1784,11 @@ class AcademicManagementApp(tk.Tk):
         self.routine_course_code_combobox = ttk.Combobox(input_frame, textvariable=self.routine_course_code_var, state="readonly")
         self.routine_course_code_combobox.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
         self.routine_course_code_combobox.bind("<<ComboboxSelected>>", self._update_routine_course_name)
-        self._populate_course_codes() # Populate on init
 
         tk.Label(input_frame, text="Course Name:", bg=NORDIC_COLORS["bg_light"], fg=NORDIC_COLORS["text_dark"]).grid(row=1, column=0, padx=5, pady=5, sticky="w")
         self.routine_course_name_label = tk.Label(input_frame, text="Select a Course Code", bg=NORDIC_COLORS["bg_light"], fg=NORDIC_COLORS["text_dark"])
         self.routine_course_name_label.grid(row=1, column=1, padx=5, pady=5, sticky="ew")
+        self._populate_course_codes() # Needs the name label above
 
 
         tk.Label(input_frame, text="Time Slot:", bg=NORDIC_COLORS["bg_light"], fg=NORDIC_COLORS["text_dark"]).grid(row=2, column=0, padx=5, pady=5, sticky="w")
@@ -1266,6 +1825,7 @@ class AcademicManagementApp(tk.Tk):
         routine_frame.pack(pady=10, fill="both", expand=True)
 
         self.routine_tree = ttk.Treeview(routine_frame, columns=("DB_ID", "CourseCode", "Time", "Weekday"), show="headings")
+        configure_row_stripes(self.routine_tree)
         self.routine_tree.heading("DB_ID", text="DB ID")
         self.routine_tree.heading("CourseCode", text="Course Code")
         self.routine_tree.heading("Time", text="Time Slot")
@@ -1278,12 +1838,10 @@ class AcademicManagementApp(tk.Tk):
 
         scrollbar = ttk.Scrollbar(routine_frame, orient="vertical", command=self.routine_tree.yview)
         scrollbar.pack(side="right", fill="y")
-        self.routine_tree.configure(yscrollcommand=scrollbar.set)
+        self.routine_view = VirtualTreeview(self.routine_tree, scrollbar)
 
         self.routine_tree.bind("<Delete>", lambda event: self.delete_selected_schedule())
-        self.routine_tree.bind("<<TreeviewSelect>>", self.on_schedule_select)
-
-        self.refresh_schedules_display()
+        self.routine_view.bind_select(self.on_schedule_select)
 
         # Buttons for routine management
         bottom_button_frame = ttk.Frame(scheduling_frame, style='TFrame')
@@ -1295,21 +1853,15 @@ class AcademicManagementApp(tk.Tk):
 
     def _populate_course_codes(self):
         """Populates the course code combobox with available course codes."""
-        course_codes = [c['course_code'] for c in self.db_manager.fetch_all_data("courses")]
-        self.routine_course_code_combobox['values'] = course_codes
+        course_codes = self._set_combobox_values(self.routine_course_code_combobox, self._index_by("courses", "course_code"))
         if course_codes:
             self.routine_course_code_var.set(course_codes[0])
             self._update_routine_course_name() # Update course name label initially
 
     def _update_routine_course_name(self, event=None):
         """Updates the course name label based on the selected course code."""
-        selected_code = self.routine_course_code_var.get()
-        course_name = ""
-        for course in self.db_manager.fetch_all_data("courses"):
-            if course['course_code'] == selected_code:
-                course_name = course['course_name']
-                break
-        self.routine_course_name_label.config(text=course_name if course_name else "Course not found")
+        course = self._index_by("courses", "course_code").get(self.routine_course_code_var.get())
+        self.routine_course_name_label.config(text=course['course_name'] if course else "Course not found")
 
     def add_class_to_routine(self):
         """Adds a new class to the routine and saves it."""
@@ -1322,36 +1874,29 @@ class AcademicManagementApp(tk.Tk):
             return
 
         # Basic clash detection (same time, same day)
-        for sched in self.schedules:
-            if sched['time_slot'] == time_slot and sched['weekday'] == weekday:
-                messagebox.showwarning("Clash Detected", f"A class is already scheduled for {weekday} at {time_slot}. Please choose a different slot.", parent=self)
-                return
+        if (weekday, time_slot) in self._index_by("routines", "weekday", "time_slot"):
+            messagebox.showwarning("Clash Detected", f"A class is already scheduled for {weekday} at {time_slot}. Please choose a different slot.", parent=self)
+            return
 
         data = {"course_code": course_code, "time_slot": time_slot, "weekday": weekday}
-        if self.db_manager.insert_data("routines", data):
-            messagebox.showinfo("Success", "Class added to routine.", parent=self)
-            self.schedules = self.db_manager.fetch_all_data("routines")
-            self.refresh_schedules_display()
+        new_id = self.db_manager.insert_data("routines", data) # The clash check above loaded the current list
+        if new_id:
+            self.show_status("Class added to routine.")
+            row = {"id": new_id, **data}
+            self._apply_local_change("routines", new_id, row)
+            self.routine_view.append_row(new_id, ROUTINE_ROW_VALUES(row))
             self.cancel_schedule_edit()
-            self.update_dashboard_info()
 
     def refresh_schedules_display(self):
         """Clears and repopulates the routine Treeview."""
         if self.routine_tree is None: return
-        for item in self.routine_tree.get_children():
-            self.routine_tree.delete(item)
-        # Configure alternating row colors for this Treeview
-        self.routine_tree.tag_configure('oddrow', background=NORDIC_COLORS["treeview_row_bg1"])
-        self.routine_tree.tag_configure('evenrow', background=NORDIC_COLORS["treeview_row_bg2"])
-        for i, sched in enumerate(self.schedules):
-            tag = 'evenrow' if i % 2 == 0 else 'oddrow'
-            self.routine_tree.insert("", "end", iid=sched['id'], values=(sched['id'], sched['course_code'], sched['time_slot'], sched['weekday']), tags=(tag,))
+        self.routine_view.set_rows([(values[0], values) for values in map(ROUTINE_ROW_VALUES, self.schedules)])
 
     def on_schedule_select(self, event):
         """Handles selection in the schedule Treeview to populate fields for editing."""
-        selected_items = self.routine_tree.selection()
+        selected_items = self.routine_view.selection()
         if selected_items:
-            values = self.routine_tree.item(selected_items[0], 'values')
+            values = self.routine_view.values(selected_items[0])
             self.selected_routine_id = values[0] # Store DB ID
             self.routine_course_code_var.set(values[1])
             self._update_routine_course_name() # Update course name label
@@ -1378,19 +1923,19 @@ class AcademicManagementApp(tk.Tk):
             return
 
         # Check for clashes, excluding the currently edited item
-        for sched in self.schedules:
-            if sched['id'] != self.selected_routine_id and \
-               sched['time_slot'] == time_slot and sched['weekday'] == weekday:
-                messagebox.showwarning("Clash Detected", f"A class is already scheduled for {weekday} at {time_slot}. Please choose a different slot.", parent=self)
-                return
+        existing = self._index_by("routines", "weekday", "time_slot").get((weekday, time_slot))
+        if existing is not None and existing['id'] != self.selected_routine_id:
+            messagebox.showwarning("Clash Detected", f"A class is already scheduled for {weekday} at {time_slot}. Please choose a different slot.", parent=self)
+            return
 
         data = {"course_code": course_code, "time_slot": time_slot, "weekday": weekday}
-        if self.db_manager.update_data("routines", self.selected_routine_id, data):
-            messagebox.showinfo("Success", "Class updated successfully.", parent=self)
-            self.schedules = self.db_manager.fetch_all_data("routines")
-            self.refresh_schedules_display()
+        record_id = self.selected_routine_id
+        if self.db_manager.update_data("routines", record_id, data):
+            self.show_status("Class updated successfully.")
+            row = {"id": record_id, **data}
+            self._apply_local_change("routines", record_id, row)
+            self.routine_view.update_row(record_id, ROUTINE_ROW_VALUES(row)) # Just this row; no full repopulate
             self.cancel_schedule_edit()
-            self.update_dashboard_info()
         else:
             messagebox.showerror("Update Failed", "Could not update class.", parent=self)
 
@@ -1405,27 +1950,26 @@ class AcademicManagementApp(tk.Tk):
         self.edit_schedule_button.config(state=tk.DISABLED)
         self.cancel_schedule_edit_button.config(state=tk.DISABLED)
         if self.routine_tree:
-            self.routine_tree.selection_remove(self.routine_tree.selection())
+            self.routine_view.clear_selection()
         self._populate_course_codes() # Re-populate combobox
 
     def delete_selected_schedule(self):
         """Deletes the selected class from the routine."""
         if self.routine_tree is None: return
-        selected_items = self.routine_tree.selection()
+        selected_items = self.routine_view.selection()
         if not selected_items:
             messagebox.showwarning("No Selection", "Please select a class to delete.", parent=self)
             return
 
-        db_id_to_delete = self.routine_tree.item(selected_items[0], 'values')[0]
-        course_code = self.routine_tree.item(selected_items[0], 'values')[1]
+        db_id_to_delete, course_code = self.routine_view.values(selected_items[0])[:2]
 
         if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete the routine for course '{course_code}'?", parent=self):
+            self._load_table("routines") # Make sure the in-memory list is current before patching it
             if self.db_manager.delete_data("routines", db_id_to_delete):
-                messagebox.showinfo("Deleted", "Class deleted successfully.", parent=self)
-                self.schedules = self.db_manager.fetch_all_data("routines")
-                self.refresh_schedules_display()
+                self.show_status("Class deleted successfully.")
+                self._apply_local_change("routines", db_id_to_delete)
+                self.routine_view.remove_row(db_id_to_delete)
                 self.cancel_schedule_edit()
-                self.update_dashboard_info()
             else:
                 messagebox.showerror("Delete Failed", "Could not delete class.", parent=self)
 
@@ -1435,13 +1979,7 @@ class AcademicManagementApp(tk.Tk):
                                                 filetypes=[("JSON files", "*.json")],
                                                 title="Export Routine", parent=self)
         if filepath:
-            try:
-                schedules_data = [dict(s) for s in self.schedules]
-                with open(filepath, 'w') as f:
-                    json.dump(schedules_data, f, indent=4)
-                messagebox.showinfo("Export Complete", f"Routine exported to {filepath}", parent=self)
-            except IOError as e:
-                messagebox.showerror("Export Error", f"Failed to export data: {e}", parent=self)
+            self._export_json(filepath, "routines", f"Routine exported to {filepath}")
 
     # --- Attendance Management Tab ---
     def init_attendance(self):
@@ -1462,11 +2000,11 @@ class AcademicManagementApp(tk.Tk):
         self.attendance_student_id_combobox = ttk.Combobox(input_frame, textvariable=self.attendance_student_id_var, state="readonly")
         self.attendance_student_id_combobox.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
         self.attendance_student_id_combobox.bind("<<ComboboxSelected>>", self._update_attendance_student_name)
-        self._populate_student_ids_for_attendance()
 
         tk.Label(input_frame, text="Student Name:", bg=NORDIC_COLORS["bg_light"], fg=NORDIC_COLORS["text_dark"]).grid(row=1, column=0, padx=5, pady=5, sticky="w")
         self.attendance_student_name_label = tk.Label(input_frame, text="Select a Student ID", bg=NORDIC_COLORS["bg_light"], fg=NORDIC_COLORS["text_dark"])
         self.attendance_student_name_label.grid(row=1, column=1, padx=5, pady=5, sticky="ew")
+        self._populate_student_ids_for_attendance() # Needs the name label above
 
         tk.Label(input_frame, text="Status:", bg=NORDIC_COLORS["bg_light"], fg=NORDIC_COLORS["text_dark"]).grid(row=2, column=0, padx=5, pady=5, sticky="w")
         self.attendance_status_var = tk.StringVar(value="Present")
@@ -1474,15 +2012,16 @@ class AcademicManagementApp(tk.Tk):
         ttk.Radiobutton(input_frame, text="Absent", variable=self.attendance_status_var, value="Absent", style='TRadiobutton').grid(row=3, column=1, padx=5, pady=5, sticky="w")
 
         tk.Label(input_frame, text="Date (YYYY-MM-DD):", bg=NORDIC_COLORS["bg_light"], fg=NORDIC_COLORS["text_dark"]).grid(row=4, column=0, padx=5, pady=5, sticky="w")
-        self.attendance_date_entry = ttk.Entry(input_frame, width=15)
-        self.attendance_date_entry.grid(row=4, column=1, padx=5, pady=5, sticky="ew")
-        self.attendance_date_entry.insert(0, datetime.now().strftime("%Y-%m-%d"))
+        self.attendance_date_var = tk.StringVar(value=date.today().isoformat())
+        ttk.Entry(input_frame, textvariable=self.attendance_date_var, width=15).grid(row=4, column=1, padx=5, pady=5, sticky="ew")
 
         button_row_frame = ttk.Frame(input_frame, style='TFrame')
         button_row_frame.grid(row=5, column=0, columnspan=2, pady=10)
 
         self.mark_attendance_button = ttk.Button(button_row_frame, text="Mark Attendance", command=self.mark_attendance, style='TButton')
         self.mark_attendance_button.pack(side="left", padx=5)
+        self.mark_all_attendance_button = ttk.Button(button_row_frame, text="Mark All Students", command=self.mark_attendance_for_all, style='TButton')
+        self.mark_all_attendance_button.pack(side="left", padx=5)
         self.edit_attendance_button = ttk.Button(button_row_frame, text="Update Selected Attendance", command=self.edit_selected_attendance, state=tk.DISABLED, style='TButton')
         self.edit_attendance_button.pack(side="left", padx=5)
         self.cancel_edit_attendance_button = ttk.Button(button_row_frame, text="Cancel Edit", command=self.cancel_attendance_edit, state=tk.DISABLED, style='TButton')
@@ -1497,6 +2036,7 @@ class AcademicManagementApp(tk.Tk):
         attendance_display_frame.pack(pady=10, fill="both", expand=True)
 
         self.attendance_tree = ttk.Treeview(attendance_display_frame, columns=("DB_ID", "StudentID", "Status", "Date"), show="headings")
+        configure_row_stripes(self.attendance_tree)
         self.attendance_tree.heading("DB_ID", text="DB ID")
         self.attendance_tree.heading("StudentID", text="Student ID")
         self.attendance_tree.heading("Status", text="Status")
@@ -1509,12 +2049,10 @@ class AcademicManagementApp(tk.Tk):
 
         scrollbar = ttk.Scrollbar(attendance_display_frame, orient="vertical", command=self.attendance_tree.yview)
         scrollbar.pack(side="right", fill="y")
-        self.attendance_tree.configure(yscrollcommand=scrollbar.set)
+        self.attendance_view = VirtualTreeview(self.attendance_tree, scrollbar)
 
         self.attendance_tree.bind("<Delete>", lambda event: self.delete_selected_attendance())
-        self.attendance_tree.bind("<<TreeviewSelect>>", self.on_attendance_select)
-
-        self.refresh_attendance_display()
+        self.attendance_view.bind_select(self.on_attendance_select)
 
         # Attendance summary
         summary_frame = tk.LabelFrame(attendance_frame, text="Attendance Summary", padx=15, pady=15,
@@ -1523,6 +2061,7 @@ class AcademicManagementApp(tk.Tk):
         summary_frame.pack(pady=10, fill="x")
 
         self.summary_tree = ttk.Treeview(summary_frame, columns=("Student", "TotalClasses", "Present", "Absent", "Percentage"), show="headings")
+        configure_row_stripes(self.summary_tree)
         self.summary_tree.heading("Student", text="Student Name")
         self.summary_tree.heading("TotalClasses", text="Total Classes")
         self.summary_tree.heading("Present", text="Present")
@@ -1535,8 +2074,6 @@ class AcademicManagementApp(tk.Tk):
         self.summary_tree.column("Percentage", width=100, anchor="center")
         self.summary_tree.pack(fill="x", expand=True)
 
-        self.update_attendance_summary()
-
         # Buttons for attendance management
         bottom_button_frame = ttk.Frame(attendance_frame, style='TFrame')
         bottom_button_frame.pack(pady=10)
@@ -1546,70 +2083,82 @@ class AcademicManagementApp(tk.Tk):
 
     def _populate_student_ids_for_attendance(self):
         """Populates the student ID combobox for attendance."""
-        student_ids = [s['student_id'] for s in self.db_manager.fetch_all_data("students")]
-        self.attendance_student_id_combobox['values'] = student_ids
+        student_ids = self._set_combobox_values(self.attendance_student_id_combobox, self._index_by("students", "student_id"))
         if student_ids:
             self.attendance_student_id_var.set(student_ids[0])
             self._update_attendance_student_name()
 
     def _update_attendance_student_name(self, event=None):
         """Updates the student name label based on the selected student ID."""
-        selected_id = self.attendance_student_id_var.get()
-        student_name = ""
-        for student in self.db_manager.fetch_all_data("students"):
-            if student['student_id'] == selected_id:
-                student_name = student['name']
-                break
-        self.attendance_student_name_label.config(text=student_name if student_name else "Student not found")
+        student = self._index_by("students", "student_id").get(self.attendance_student_id_var.get())
+        self.attendance_student_name_label.config(text=student['name'] if student else "Student not found")
 
     def mark_attendance(self):
         """Marks attendance for a student and saves it."""
         student_id = self.attendance_student_id_var.get().strip()
         status = self.attendance_status_var.get()
-        current_date = self.attendance_date_entry.get().strip()
+        current_date = self.attendance_date_var.get().strip()
 
         if not student_id:
             messagebox.showwarning("Input Error", "Please select a student ID.", parent=self)
             return
-        try:
-            datetime.strptime(current_date, "%Y-%m-%d")
-        except ValueError:
+        current_date = parse_date(current_date) # Stored zero-padded so it sorts and compares as text
+        if current_date is None:
             messagebox.showerror("Invalid Date", "Please enter date inYYYY-MM-DD format.", parent=self)
             return
 
         data = {"student_id": student_id, "status": status, "date": current_date}
-        if self.db_manager.insert_data("attendance", data):
-            messagebox.showinfo("Success", "Attendance marked.", parent=self)
-            self.attendance_records = self.db_manager.fetch_all_data("attendance")
-            self.refresh_attendance_display()
-            self.update_attendance_summary()
+        counts = self._attendance_tally() # Also makes sure the in-memory list is current before patching it
+        new_id = self.db_manager.insert_data("attendance", data)
+        if new_id:
+            self.show_status("Attendance marked.")
+            self._apply_local_change("attendance", new_id, {"id": new_id, **data})
+            self._count_attendance(counts, student_id, status, 1)
+            self.attendance_view.append_row(new_id, ATTENDANCE_ROW_VALUES({"id": new_id, **data}))
+            self._patch_attendance_summary(counts, student_id)
+            self.cancel_attendance_edit()
+
+    def mark_attendance_for_all(self):
+        """Marks every registered student with the selected status for the entered date in one transaction."""
+        status = self.attendance_status_var.get()
+        current_date = self.attendance_date_var.get().strip()
+        current_date = parse_date(current_date) # Stored zero-padded so it sorts and compares as text
+        if current_date is None:
+            messagebox.showerror("Invalid Date", "Please enter date inYYYY-MM-DD format.", parent=self)
+            return
+
+        students = self._load_table("students")
+        if not students:
+            messagebox.showwarning("No Students", "There are no registered students to mark.", parent=self)
+            return
+        if not messagebox.askyesno("Confirm Mark All", f"Mark all {len(students)} student(s) as {status} on {current_date}?", parent=self):
+            return
+
+        rows = [{"student_id": s['student_id'], "status": status, "date": current_date} for s in students]
+        if self.db_manager.insert_many("attendance", rows) is not False:
+            self.show_status(f"Attendance marked for {len(rows)} student(s).")
+            self._load_table("attendance")
+            self._debounced("attendance", self.refresh_attendance_display)
+            self._debounced("attendance_summary", self.update_attendance_summary)
             self.cancel_attendance_edit()
-            self.update_dashboard_info()
 
     def refresh_attendance_display(self):
         """Clears and repopulates the attendance Treeview."""
         if self.attendance_tree is None: return
-        for item in self.attendance_tree.get_children():
-            self.attendance_tree.delete(item)
-        # Configure alternating row colors for this Treeview
-        self.attendance_tree.tag_configure('oddrow', background=NORDIC_COLORS["treeview_row_bg1"])
-        self.attendance_tree.tag_configure('evenrow', background=NORDIC_COLORS["treeview_row_bg2"])
-        for i, record in enumerate(self.attendance_records):
-            tag = 'evenrow' if i % 2 == 0 else 'oddrow'
-            self.attendance_tree.insert("", "end", iid=record['id'], values=(record['id'], record['student_id'], record['status'], record['date']), tags=(tag,))
+        self.attendance_view.set_rows((values[0], values) for values in map(ATTENDANCE_ROW_VALUES, self.attendance_records))
 
     def on_attendance_select(self, event):
         """Handles selection in the attendance Treeview to populate fields for editing."""
-        selected_items = self.attendance_tree.selection()
+        selected_items = self.attendance_view.selection()
         if selected_items:
-            values = self.attendance_tree.item(selected_items[0], 'values')
+            values = self.attendance_view.values(selected_items[0])
             self.selected_attendance_id = values[0] # Store DB ID
             self.attendance_student_id_var.set(values[1])
             self._update_attendance_student_name()
             self.attendance_status_var.set(values[2])
-            self.attendance_date_entry.delete(0, tk.END)
-            self.attendance_date_entry.insert(0, values[3])
+            self.attendance_date_var.set(values[3])
             self.mark_attendance_button.config(state=tk.DISABLED)
+            self.mark_all_attendance_button.config(state=tk.DISABLED)
             self.edit_attendance_button.config(state=tk.NORMAL)
             self.cancel_edit_attendance_button.config(state=tk.NORMAL)
         else:
@@ -1623,25 +2172,29 @@ class AcademicManagementApp(tk.Tk):
 
         student_id = self.attendance_student_id_var.get().strip()
         status = self.attendance_status_var.get()
-        current_date = self.attendance_date_entry.get().strip()
+        current_date = self.attendance_date_var.get().strip()
 
         if not student_id:
             messagebox.showwarning("Input Error", "Please select a student ID.", parent=self)
             return
-        try:
-            datetime.strptime(current_date, "%Y-%m-%d")
-        except ValueError:
+        current_date = parse_date(current_date) # Stored zero-padded so it sorts and compares as text
+        if current_date is None:
             messagebox.showerror("Invalid Date", "Please enter date inYYYY-MM-DD format.", parent=self)
             return
 
         data = {"student_id": student_id, "status": status, "date": current_date}
-        if self.db_manager.update_data("attendance", self.selected_attendance_id, data):
-            messagebox.showinfo("Success", "Attendance record updated successfully.", parent=self)
-            self.attendance_records = self.db_manager.fetch_all_data("attendance")
-            self.refresh_attendance_display()
-            self.update_attendance_summary()
+        counts = self._attendance_tally()
+        record_id = self.selected_attendance_id
+        old_values = self.attendance_view.values(record_id)
+        if self.db_manager.update_data("attendance", record_id, data):
+            self.show_status("Attendance record updated successfully.")
+            row = {"id": record_id, **data}
+            self._apply_local_change("attendance", record_id, row)
+            self._count_attendance(counts, student_id, status, 1) # Add first so a same-student edit never drops (and reorders) the tally entry
+            self._count_attendance(counts, old_values[1], old_values[2], -1)
+            self.attendance_view.update_row(record_id, ATTENDANCE_ROW_VALUES(row))
+            self._patch_attendance_summary(counts, old_values[1], student_id)
             self.cancel_attendance_edit()
-            self.update_dashboard_info()
         else:
             messagebox.showerror("Update Failed", "Could not update attendance record.", parent=self)
 
@@ -1651,63 +2204,52 @@ class AcademicManagementApp(tk.Tk):
         self.attendance_student_id_var.set("")
         self.attendance_student_name_label.config(text="Select a Student ID")
         self.attendance_status_var.set("Present")
-        self.attendance_date_entry.delete(0, tk.END)
-        self.attendance_date_entry.insert(0, datetime.now().strftime("%Y-%m-%d"))
+        self.attendance_date_var.set(date.today().isoformat())
         self.mark_attendance_button.config(state=tk.NORMAL)
+        self.mark_all_attendance_button.config(state=tk.NORMAL)
         self.edit_attendance_button.config(state=tk.DISABLED)
         self.cancel_edit_attendance_button.config(state=tk.DISABLED)
         if self.attendance_tree:
-            self.attendance_tree.selection_remove(self.attendance_tree.selection())
+            self.attendance_view.clear_selection()
         self._populate_student_ids_for_attendance()
 
     def delete_selected_attendance(self):
         """Deletes the selected attendance record."""
         if self.attendance_tree is None: return
-        selected_items = self.attendance_tree.selection()
+        selected_items = self.attendance_view.selection()
         if not selected_items:
             messagebox.showwarning("No Selection", "Please select an attendance record to delete.", parent=self)
             return
 
-        db_id_to_delete = self.attendance_tree.item(selected_items[0], 'values')[0]
-        student_id = self.attendance_tree.item(selected_items[0], 'values')[1]
-        record_date = self.attendance_tree.item(selected_items[0], 'values')[3]
+        db_id_to_delete, student_id, status, record_date = self.attendance_view.values(selected_items[0])
 
         if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete the attendance record for student '{student_id}' on {record_date}?", parent=self):
+            counts = self._attendance_tally()
             if self.db_manager.delete_data("attendance", db_id_to_delete):
-                messagebox.showinfo("Deleted", "Attendance record deleted successfully.", parent=self)
-                self.attendance_records = self.db_manager.fetch_all_data("attendance")
-                self.refresh_attendance_display()
-                self.update_attendance_summary()
+                self.show_status("Attendance record deleted successfully.")
+                self._apply_local_change("attendance", db_id_to_delete)
+                self._count_attendance(counts, student_id, status, -1)
+                self.attendance_view.remove_row(db_id_to_delete)
+                self._patch_attendance_summary(counts, student_id)
                 self.cancel_attendance_edit()
-                self.update_dashboard_info()
             else:
                 messagebox.showerror("Delete Failed", "Could not delete attendance record.", parent=self)
 
     def update_attendance_summary(self):
         """Calculates and displays attendance percentages for each student."""
         if self.summary_tree is None: return
-        for item in self.summary_tree.get_children():
-            self.summary_tree.delete(item)
-        # Configure alternating row colors for this Treeview
-        self.summary_tree.tag_configure('oddrow', background=NORDIC_COLORS["treeview_row_bg1"])
-        self.summary_tree.tag_configure('evenrow', background=NORDIC_COLORS["treeview_row_bg2"])
-
-        student_attendance_counts = {} # {student_id: {'present': count, 'total': count, 'name': 'Student Name'}}
-        all_students = self.db_manager.fetch_all_data("students")
-        student_id_to_name = {s['student_id']: s['name'] for s in all_students}
-
-        for record in self.attendance_records:
-            student_id = record['student_id']
-            if student_id not in student_attendance_counts:
-                student_attendance_counts[student_id] = {'present': 0, 'total': 0, 'name': student_id_to_name.get(student_id, student_id)}
-            student_attendance_counts[student_id]['total'] += 1
-            if record['status'] == 'Present':
-                student_attendance_counts[student_id]['present'] += 1
-
-        for i, (student_id, counts) in enumerate(student_attendance_counts.items()):
-            percentage = (counts['present'] / counts['total']) * 100 if counts['total'] > 0 else 0
-            tag = 'evenrow' if i % 2 == 0 else 'oddrow'
-            self.summary_tree.insert("", "end", values=(counts['name'], counts['total'], counts['present'], counts['total'] - counts['present'], f"{percentage:.2f}%"), tags=(tag,))
+        self.summary_tree.delete(*self.summary_tree.get_children()) # One Tcl call instead of one per row
+
+        students = self._index_by("students", "student_id")
+        counts = self._attendance_tally()
+        # Rows are keyed by student ID so single-record changes can rewrite just that student's row
+        append_rows(self.summary_tree, [(student_id, attendance_summary_values(students, student_id, tally), ROW_TAGS[i & 1])
+                                        for i, (student_id, tally) in enumerate(counts.items())])
+        self._summary_sources["attendance_summary"] = counts
+
+    def _patch_attendance_summary(self, counts, *student_ids):
+        """Refreshes the attendance summary rows of the given students after a single-record change."""
+        self._patch_summary("attendance_summary", self.summary_tree, self.update_attendance_summary, counts, student_ids, attendance_summary_values)
 
     def export_attendance(self):
         """Exports the current attendance records to a JSON file."""
@@ -1715,13 +2257,7 @@ class AcademicManagementApp(tk.Tk):
                                                 filetypes=[("JSON files", "*.json")],
                                                 title="Export Attendance Records", parent=self)
         if filepath:
-            try:
-                attendance_data = [dict(r) for r in self.attendance_records]
-                with open(filepath, 'w') as f:
-                    json.dump(attendance_data, f, indent=4)
-                messagebox.showinfo("Export Complete", f"Attendance records exported to {filepath}", parent=self)
-            except IOError as e:
-                messagebox.showerror("Export Error", f"Failed to export data: {e}", parent=self)
+            self._export_json(filepath, "attendance", f"Attendance records exported to {filepath}")
 
     # --- Grading & Assessment Tab ---
     def init_assessment(self):
@@ -1742,11 +2278,11 @@ class AcademicManagementApp(tk.Tk):
         self.assess_student_id_combobox = ttk.Combobox(input_frame, textvariable=self.assess_student_id_var, state="readonly")
         self.assess_student_id_combobox.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
         self.assess_student_id_combobox.bind("<<ComboboxSelected>>", self._update_assess_student_name)
-        self._populate_student_ids_for_grades()
 
         tk.Label(input_frame, text="Student Name:", bg=NORDIC_COLORS["bg_light"], fg=NORDIC_COLORS["text_dark"]).grid(row=1, column=0, padx=5, pady=5, sticky="w")
         self.assess_student_name_label = tk.Label(input_frame, text="Select a Student ID", bg=NORDIC_COLORS["bg_light"], fg=NORDIC_COLORS["text_dark"])
         self.assess_student_name_label.grid(row=1, column=1, padx=5, pady=5, sticky="ew")
+        self._populate_student_ids_for_grades() # Needs the name label above
 
 
         tk.Label(input_frame, text="Assessment Type:", bg=NORDIC_COLORS["bg_light"], fg=NORDIC_COLORS["text_dark"]).grid(row=2, column=0, padx=5, pady=5, sticky="w")
@@ -1780,6 +2316,7 @@ class AcademicManagementApp(tk.Tk):
         grades_display_frame.pack(pady=10, fill="both", expand=True)
 
         self.grades_tree = ttk.Treeview(grades_display_frame, columns=("DB_ID", "StudentID", "Type", "Marks", "GPA"), show="headings")
+        configure_row_stripes(self.grades_tree)
         self.grades_tree.heading("DB_ID", text="DB ID")
         self.grades_tree.heading("StudentID", text="Student ID")
         self.grades_tree.heading("Type", text="Assessment Type")
@@ -1794,12 +2331,10 @@ class AcademicManagementApp(tk.Tk):
 
         scrollbar = ttk.Scrollbar(grades_display_frame, orient="vertical", command=self.grades_tree.yview)
         scrollbar.pack(side="right", fill="y")
-        self.grades_tree.configure(yscrollcommand=scrollbar.set)
+        self.grades_view = VirtualTreeview(self.grades_tree, scrollbar)
 
         self.grades_tree.bind("<Delete>", lambda event: self.delete_selected_grade())
-        self.grades_tree.bind("<<TreeviewSelect>>", self.on_grade_select)
-
-        self.refresh_grades_display()
+        self.grades_view.bind_select(self.on_grade_select)
 
         # Student GPA summary
         gpa_summary_frame = tk.LabelFrame(assessment_frame, text="Student GPA Summary", padx=15, pady=15,
@@ -1808,14 +2343,13 @@ class AcademicManagementApp(tk.Tk):
         gpa_summary_frame.pack(pady=10, fill="x")
 
         self.gpa_summary_tree = ttk.Treeview(gpa_summary_frame, columns=("StudentName", "OverallGPA"), show="headings")
+        configure_row_stripes(self.gpa_summary_tree)
         self.gpa_summary_tree.heading("StudentName", text="Student Name")
         self.gpa_summary_tree.heading("OverallGPA", text="Overall GPA")
         self.gpa_summary_tree.column("StudentName", width=200, anchor="w")
         self.gpa_summary_tree.column("OverallGPA", width=150, anchor="center")
         self.gpa_summary_tree.pack(fill="x", expand=True)
 
-        self.update_gpa_summary()
-
         # Buttons for grades management
         bottom_button_frame = ttk.Frame(assessment_frame, style='TFrame')
         bottom_button_frame.pack(pady=10)
@@ -1826,44 +2360,23 @@ class AcademicManagementApp(tk.Tk):
 
     def _populate_student_ids_for_grades(self):
         """Populates the student ID combobox for grades."""
-        student_ids = [s['student_id'] for s in self.db_manager.fetch_all_data("students")]
-        self.assess_student_id_combobox['values'] = student_ids
+        student_ids = self._set_combobox_values(self.assess_student_id_combobox, self._index_by("students", "student_id"))
         if student_ids:
             self.assess_student_id_var.set(student_ids[0])
             self._update_assess_student_name()
 
     def _update_assess_student_name(self, event=None):
         """Updates the student name label based on the selected student ID."""
-        selected_id = self.assess_student_id_var.get()
-        student_name = ""
-        for student in self.db_manager.fetch_all_data("students"):
-            if student['student_id'] == selected_id:
-                student_name = student['name']
-                break
-        self.assess_student_name_label.config(text=student_name if student_name else "Student not found")
+        student = self._index_by("students", "student_id").get(self.assess_student_id_var.get())
+        self.assess_student_name_label.config(text=student['name'] if student else "Student not found")
 
     def _validate_marks_input(self, P):
         """Validates that input for marks is a number or empty string."""
-        if P.strip() == "":
-            return True # Allow empty string for initial entry
-        try:
-            float(P)
-            return True
-        except ValueError:
-            return False
+        return MARKS_INPUT(P) is not None
 
     def calculate_grade_point(self, marks):
         """Calculates grade point based on marks."""
-        if marks >= 80: return 4.00
-        elif marks >= 75: return 3.75
-        elif marks >= 70: return 3.50
-        elif marks >= 65: return 3.25
-        elif marks >= 60: return 3.00
-        elif marks >= 55: return 2.75
-        elif marks >= 50: return 2.50
-        elif marks >= 45: return 2.25
-        elif marks >= 40: return 2.00
-        else: return 0.00
+        return GRADE_POINTS[bisect_right(GRADE_THRESHOLDS, marks)]
 
     def add_grade(self):
         """Adds a new grade record and saves it."""
@@ -1891,31 +2404,27 @@ class AcademicManagementApp(tk.Tk):
             "marks": marks,
             "grade_point": grade_point
         }
-        if self.db_manager.insert_data("grades", data):
-            messagebox.showinfo("Success", "Grade added.", parent=self)
-            self.grades = self.db_manager.fetch_all_data("grades")
-            self.refresh_grades_display()
-            self.update_gpa_summary()
+        totals = self._gpa_tally() # Also makes sure the in-memory list is current before patching it
+        new_id = self.db_manager.insert_data("grades", data)
+        if new_id:
+            self.show_status("Grade added.")
+            row = {"id": new_id, **data}
+            self._apply_local_change("grades", new_id, row)
+            self._count_grade(totals, student_id, grade_point, 1)
+            self.grades_view.append_row(new_id, grade_row_values(row))
+            self._patch_gpa_summary(totals, student_id)
             self.cancel_grade_edit()
-            self.update_dashboard_info()
 
     def refresh_grades_display(self):
         """Clears and repopulates the grades Treeview."""
         if self.grades_tree is None: return
-        for item in self.grades_tree.get_children():
-            self.grades_tree.delete(item)
-        # Configure alternating row colors for this Treeview
-        self.grades_tree.tag_configure('oddrow', background=NORDIC_COLORS["treeview_row_bg1"])
-        self.grades_tree.tag_configure('evenrow', background=NORDIC_COLORS["treeview_row_bg2"])
-        for i, grade in enumerate(self.grades):
-            tag = 'evenrow' if i % 2 == 0 else 'oddrow'
-            self.grades_tree.insert("", "end", iid=grade['id'], values=(grade['id'], grade['student_id'], grade['assessment_type'], grade['marks'], f"{grade['grade_point']:.2f}"), tags=(tag,))
+        self.grades_view.set_rows((values[0], values) for values in map(grade_row_values, self.grades))
 
     def on_grade_select(self, event):
         """Handles selection in the grades Treeview to populate fields for editing."""
-        selected_items = self.grades_tree.selection()
+        selected_items = self.grades_view.selection()
         if selected_items:
-            values = self.grades_tree.item(selected_items[0], 'values')
+            values = self.grades_view.values(selected_items[0])
             self.selected_grade_id = values[0] # Store DB ID
             self.assess_student_id_var.set(values[1])
             self._update_assess_student_name()
@@ -1957,13 +2466,19 @@ class AcademicManagementApp(tk.Tk):
             "marks": marks,
             "grade_point": grade_point
         }
-        if self.db_manager.update_data("grades", self.selected_grade_id, data):
-            messagebox.showinfo("Success", "Grade updated successfully.", parent=self)
-            self.grades = self.db_manager.fetch_all_data("grades")
-            self.refresh_grades_display()
-            self.update_gpa_summary()
+        totals = self._gpa_tally()
+        record_id = self.selected_grade_id
+        old_row = self._local_row("grades", record_id)
+        if self.db_manager.update_data("grades", record_id, data):
+            self.show_status("Grade updated successfully.")
+            row = {"id": record_id, **data}
+            self._apply_local_change("grades", record_id, row)
+            self._count_grade(totals, student_id, grade_point, 1) # Add first so a same-student edit never drops (and reorders) the tally entry
+            if old_row is not None:
+                self._count_grade(totals, old_row['student_id'], old_row['grade_point'], -1)
+            self.grades_view.update_row(record_id, grade_row_values(row))
+            self._patch_gpa_summary(totals, old_row['student_id'] if old_row is not None else student_id, student_id)
             self.cancel_grade_edit()
-            self.update_dashboard_info()
         else:
             messagebox.showerror("Update Failed", "Could not update grade.", parent=self)
 
@@ -1978,56 +2493,47 @@ class AcademicManagementApp(tk.Tk):
         self.edit_grade_button.config(state=tk.DISABLED)
         self.cancel_edit_grade_button.config(state=tk.DISABLED)
         if self.grades_tree:
-            self.grades_tree.selection_remove(self.grades_tree.selection())
+            self.grades_view.clear_selection()
         self._populate_student_ids_for_grades()
 
     def delete_selected_grade(self):
         """Deletes the selected grade record."""
         if self.grades_tree is None: return
-        selected_items = self.grades_tree.selection()
+        selected_items = self.grades_view.selection()
         if not selected_items:
             messagebox.showwarning("No Selection", "Please select a grade record to delete.", parent=self)
             return
 
-        db_id_to_delete = self.grades_tree.item(selected_items[0], 'values')[0]
-        student_id = self.grades_tree.item(selected_items[0], 'values')[1]
-        assessment_type = self.grades_tree.item(selected_items[0], 'values')[2]
+        db_id_to_delete, student_id, assessment_type = self.grades_view.values(selected_items[0])[:3]
 
         if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete the grade for student '{student_id}' ({assessment_type})?", parent=self):
+            totals = self._gpa_tally()
+            old_row = self._local_row("grades", db_id_to_delete)
             if self.db_manager.delete_data("grades", db_id_to_delete):
-                messagebox.showinfo("Deleted", "Grade record deleted successfully.", parent=self)
-                self.grades = self.db_manager.fetch_all_data("grades")
-                self.refresh_grades_display()
-                self.update_gpa_summary()
+                self.show_status("Grade record deleted successfully.")
+                self._apply_local_change("grades", db_id_to_delete)
+                if old_row is not None:
+                    self._count_grade(totals, old_row['student_id'], old_row['grade_point'], -1)
+                self.grades_view.remove_row(db_id_to_delete)
+                self._patch_gpa_summary(totals, student_id)
                 self.cancel_grade_edit()
-                self.update_dashboard_info()
             else:
                 messagebox.showerror("Delete Failed", "Could not delete grade record.", parent=self)
 
     def update_gpa_summary(self):
         """Calculates and displays overall GPA for each student."""
         if self.gpa_summary_tree is None: return
-        for item in self.gpa_summary_tree.get_children():
-            self.gpa_summary_tree.delete(item)
-        # Configure alternating row colors for this Treeview
-        self.gpa_summary_tree.tag_configure('oddrow', background=NORDIC_COLORS["treeview_row_bg1"])
-        self.gpa_summary_tree.tag_configure('evenrow', background=NORDIC_COLORS["treeview_row_bg2"])
-
-        student_gpas = {} # {student_id: {'total_points': sum, 'count': count}}
-        all_students = self.db_manager.fetch_all_data("students")
-        student_id_to_name = {s['student_id']: s['name'] for s in all_students}
-
-        for grade in self.grades:
-            student_id = grade['student_id']
-            if student_id not in student_gpas:
-                student_gpas[student_id] = {'total_points': 0, 'count': 0, 'name': student_id_to_name.get(student_id, student_id)}
-            student_gpas[student_id]['total_points'] += grade['grade_point']
-            student_gpas[student_id]['count'] += 1
-
-        for i, (student_id, data) in enumerate(student_gpas.items()):
-            overall_gpa = (data['total_points'] / data['count']) if data['count'] > 0 else 0
-            tag = 'evenrow' if i % 2 == 0 else 'oddrow'
-            self.gpa_summary_tree.insert("", "end", values=(data['name'], f"{overall_gpa:.2f}"), tags=(tag,))
+        self.gpa_summary_tree.delete(*self.gpa_summary_tree.get_children()) # One Tcl call instead of one per row
+
+        students = self._index_by("students", "student_id") # Cached until the students table changes
+        totals = self._gpa_tally() # Per-student sums and counts from one GROUP BY, then kept up to date per write
+        append_rows(self.gpa_summary_tree, [(student_id, gpa_summary_values(students, student_id, tally), ROW_TAGS[i & 1])
+                                            for i, (student_id, tally) in enumerate(totals.items())])
+        self._summary_sources["gpa_summary"] = totals
+
+    def _patch_gpa_summary(self, totals, *student_ids):
+        """Refreshes the GPA summary rows of the given students after a single-grade change."""
+        self._patch_summary("gpa_summary", self.gpa_summary_tree, self.update_gpa_summary, totals, student_ids, gpa_summary_values)
 
     def export_grades(self):
         """Exports the current grades to a JSON file."""
@@ -2035,13 +2541,7 @@ class AcademicManagementApp(tk.Tk):
                                                 filetypes=[("JSON files", "*.json")],
                                                 title="Export Grades Records", parent=self)
         if filepath:
-            try:
-                grades_data = [dict(g) for g in self.grades]
-                with open(filepath, 'w') as f:
-                    json.dump(grades_data, f, indent=4)
-                messagebox.showinfo("Export Complete", f"Grades records exported to {filepath}", parent=self)
-            except IOError as e:
-                messagebox.showerror("Export Error", f"Failed to export data: {e}", parent=self)
+            self._export_json(filepath, "grades", f"Grades records exported to {filepath}")
 
     # --- Application & Document Generator Tab ---
     def init_application_generator(self):
@@ -2059,16 +2559,7 @@ class AcademicManagementApp(tk.Tk):
 
         tk.Label(input_frame, text="Select Application Type:", bg=NORDIC_COLORS["bg_light"], fg=NORDIC_COLORS["text_dark"]).grid(row=0, column=0, padx=5, pady=5, sticky="w")
         self.application_type_var = tk.StringVar()
-        app_types = [
-            "Class Reschedule",
-            "Requisition Request",
-            "Leave Application",
-            "Recommendation Letter",
-            "Financial Assistance Request",
-            "Makeup Exam Request",
-            "Add/Drop Course Request",
-            "Formal Letter to Registrar/Chairperson"
-        ]
+        app_types = list(APPLICATION_TEMPLATES)
         self.application_type_var.set(app_types[0])
         ttk.OptionMenu(input_frame, self.application_type_var, *app_types).grid(row=0, column=1, padx=5, pady=5, sticky="ew")
 
@@ -2123,56 +2614,11 @@ class AcademicManagementApp(tk.Tk):
         salutation = "To,\nThe Chairperson,\nDepartment of English Language and Literature,\nCentral Women's University.\n\n"
         closing = f"\n\nSincerely,\n{applicant_name}"
 
+        template = APPLICATION_TEMPLATES.get(app_type)
         body = ""
-
-        if app_type == "Class Reschedule":
-            body = (f"Subject: Request for Class Reschedule\n\n"
-                    f"Dear Sir/Madam,\n\n"
-                    f"I, {applicant_name}, would like to request the rescheduling of my class due to the following reason:\n"
-                    f"{details}\n"
-                    "I kindly ask for your consideration and approval.\n")
-        elif app_type == "Requisition Request":
-            body = (f"Subject: Requisition Request\n\n"
-                    f"Dear Sir/Madam,\n\n"
-                    f"I, {applicant_name}, request the requisition of the following materials:\n"
-                    f"{details}\n"
-                    "I hope for your prompt approval.\n")
-        elif app_type == "Leave Application":
-            body = (f"Subject: Leave Application\n\n"
-                    f"Dear Sir/Madam,\n\n"
-                    f"I, {applicant_name}, request leave for the following reason(s):\n"
-                    f"{details}\n"
-                    "I shall be grateful for your kind consideration.\n")
-        elif app_type == "Recommendation Letter":
-            body = (f"Subject: Request for Recommendation Letter\n\n"
-                    f"Dear Sir/Madam,\n\n"
-                    f"I, {applicant_name}, humbly request a recommendation letter for the following purpose:\n"
-                    f"{details}\n"
-                    "I appreciate your time and support.\n")
-        elif app_type == "Financial Assistance Request":
-            body = (f"Subject: Request for Financial Assistance\n\n"
-                    f"Dear Sir/Madam,\n\n"
-                    f"I, {applicant_name}, am writing to request financial assistance due to:\n"
-                    f"{details}\n"
-                    "I sincerely hope for your positive response.\n")
-        elif app_type == "Makeup Exam Request":
-            body = (f"Subject: Request for Makeup Examination\n\n"
-                    f"Dear Sir/Madam,\n\n"
-                    f"I, {applicant_name}, could not attend the examination due to the following reason(s):\n"
-                    f"{details}\n"
-                    "I kindly request to be allowed a makeup examination.\n")
-        elif app_type == "Add/Drop Course Request":
-            body = (f"Subject: Request to Add/Drop Course\n\n"
-                    f"Dear Sir/Madam,\n\n"
-                    f"I, {applicant_name}, request to add/drop the following course(s):\n"
-                    f"{details}\n"
-                    "Thank you for your understanding and support.\n")
-        elif app_type == "Formal Letter to Registrar/Chairperson":
-            body = (f"Subject: Formal Letter\n\n"
-                    f"Dear Sir/Madam,\n\n"
-                    f"I, {applicant_name}, am writing with the following matter:\n"
-                    f"{details}\n"
-                    "Your attention to this matter is greatly appreciated.\n")
+        if template:
+            subject, intro, request_line = template
+            body = f"Subject: {subject}\n\nDear Sir/Madam,\n\nI, {applicant_name}, {intro}\n{details}\n{request_line}\n"
 
         full_text = header + salutation + body + closing
 
@@ -2204,7 +2650,7 @@ class AcademicManagementApp(tk.Tk):
                                                 title="Save Application Letter", parent=self)
         if filepath:
             try:
-                with open(filepath, 'w') as f:
+                with open(filepath, 'w', encoding='utf-8') as f: # Not the locale codec, which can fail on names it cannot encode
                     f.write(text_to_save)
                 messagebox.showinfo("Saved", f"Application letter saved to {filepath}", parent=self)
             except IOError as e:
@@ -2235,15 +2681,19 @@ class AcademicManagementApp(tk.Tk):
         day_names_frame = ttk.Frame(calendar_frame, style='TFrame')
         day_names_frame.pack(fill="x")
         days_of_week = ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]
+        # Changed to tk.Label for direct foreground/background control; the seven headers share one option set
+        header_options = {"font": ("Arial", 10, "bold"), "width": 10, "bg": NORDIC_COLORS["bg_dark"], "fg": NORDIC_COLORS["text_dark"],
+                          "relief": "solid", "borderwidth": 1}
+        header_pack = {"side": "left", "fill": "both", "expand": True}
         for day in days_of_week:
-            # Changed to tk.Label for direct foreground/background control
-            tk.Label(day_names_frame, text=day, font=("Arial", 10, "bold"), width=10,
-                     bg=NORDIC_COLORS["bg_dark"], fg=NORDIC_COLORS["text_dark"],
-                     relief="solid", borderwidth=1).pack(side="left", fill="both", expand=True)
+            tk.Label(day_names_frame, header_options, text=day).pack(header_pack)
 
-        # Calendar Grid Frame
-        self.calendar_grid_frame = ttk.Frame(calendar_frame, style='TFrame') # Initialized here
-        self.calendar_grid_frame.pack(expand=True, fill="both")
+        # Calendar Grid: one canvas with a rectangle and a text item per day cell
+        self.calendar_canvas = tk.Canvas(calendar_frame, height=240, bg=NORDIC_COLORS["bg_light"], highlightthickness=0) # Initialized here
+        self._calendar_cells = []
+        self.calendar_canvas.pack(expand=True, fill="both")
+        self.calendar_canvas.bind("<Configure>", self._paint_calendar)
+        self.calendar_canvas.bind("<Button-1>", self.on_calendar_click)
 
         # Event List Frame
         event_list_frame = tk.LabelFrame(calendar_frame, text="Events for Selected Day", padx=10, pady=10,
@@ -2252,6 +2702,7 @@ class AcademicManagementApp(tk.Tk):
         event_list_frame.pack(pady=15, fill="x")
 
         self.event_list_tree = ttk.Treeview(event_list_frame, columns=("Event", "Type"), show="headings", height=5) # Initialized here
+        configure_row_stripes(self.event_list_tree)
         self.event_list_tree.heading("Event", text="Event Description")
         self.event_list_tree.heading("Type", text="Type")
         self.event_list_tree.column("Event", width=300, anchor="w")
@@ -2271,13 +2722,12 @@ class AcademicManagementApp(tk.Tk):
         add_event_frame.pack(pady=10, fill="x")
 
         tk.Label(add_event_frame, text="Date (YYYY-MM-DD):", bg=NORDIC_COLORS["bg_light"], fg=NORDIC_COLORS["text_dark"]).grid(row=0, column=0, padx=5, pady=5, sticky="w")
-        self.event_date_entry = ttk.Entry(add_event_frame, width=15)
-        self.event_date_entry.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
-        self.event_date_entry.insert(0, datetime.now().strftime("%Y-%m-%d")) # Default to today
+        self.event_date_var = tk.StringVar(value=date.today().isoformat()) # Default to today
+        ttk.Entry(add_event_frame, textvariable=self.event_date_var, width=15).grid(row=0, column=1, padx=5, pady=5, sticky="ew")
 
         tk.Label(add_event_frame, text="Description:", bg=NORDIC_COLORS["bg_light"], fg=NORDIC_COLORS["text_dark"]).grid(row=1, column=0, padx=5, pady=5, sticky="w")
-        self.event_desc_entry = ttk.Entry(add_event_frame, width=40)
-        self.event_desc_entry.grid(row=1, column=1, padx=5, pady=5, sticky="ew")
+        self.event_desc_var = tk.StringVar()
+        ttk.Entry(add_event_frame, textvariable=self.event_desc_var, width=40).grid(row=1, column=1, padx=5, pady=5, sticky="ew")
 
         tk.Label(add_event_frame, text="Event Type:", bg=NORDIC_COLORS["bg_light"], fg=NORDIC_COLORS["text_dark"]).grid(row=2, column=0, padx=5, pady=5, sticky="w")
         self.event_type_var = tk.StringVar()
@@ -2288,70 +2738,101 @@ class AcademicManagementApp(tk.Tk):
         ttk.Button(add_event_frame, text="Add Event", command=self.add_calendar_event, style='TButton').grid(row=3, column=0, columnspan=2, pady=10)
         add_event_frame.grid_columnconfigure(1, weight=1)
 
-        self.draw_calendar() # Call draw_calendar after all its dependencies are initialized
-
 
     def draw_calendar(self):
         """Draws the calendar grid for the current month and year."""
         # Add a check to ensure calendar components are initialized
-        if self.calendar_grid_frame is None or self.month_year_label is None or self.event_list_tree is None:
+        if self.calendar_canvas is None or self.month_year_label is None or self.event_list_tree is None:
             return # Cannot draw if components are not ready
 
-        # Clear previous calendar buttons
-        for widget in self.calendar_grid_frame.winfo_children():
-            widget.destroy()
-
         self.month_year_label.config(text=f"{calendar.month_name[self.current_month]} {self.current_year}")
 
-        cal = calendar.Calendar()
-        month_days = cal.monthdayscalendar(self.current_year, self.current_month)
-
-        for week_idx, week in enumerate(month_days):
-            for day_idx, day in enumerate(week):
-                day_text = str(day) if day != 0 else ""
-                event_indicator = ""
-
-                # Default colors for tk.Button
-                bg_color = NORDIC_COLORS["calendar_day_bg"]
-                fg_color = NORDIC_COLORS["calendar_day_fg"]
-                active_bg_color = NORDIC_COLORS["calendar_active_bg"]
-                active_fg_color = NORDIC_COLORS["calendar_active_fg"]
-
-                if day != 0:
-                    current_date_str = f"{self.current_year}-{self.current_month:02d}-{day:02d}"
-                    events_on_day = [e for e in self.calendar_events if e['date'] == current_date_str]
-                    if events_on_day:
-                        bg_color = NORDIC_COLORS["calendar_event_bg"] # Event day background (light green)
-                        event_indicator = " •" # Small dot to indicate events
-                        if any(e['type'] == 'Holiday' for e in events_on_day):
-                            bg_color = NORDIC_COLORS["calendar_holiday_bg"] # Holiday background (light red)
-                            fg_color = NORDIC_COLORS["accent_red"] # Holiday foreground (dark red)
-                        elif any(e['type'] == 'Exam' for e in events_on_day):
-                            # Could add a specific color for exams if desired, currently uses event color
-                            pass
-
-                    if datetime.now().day == day and datetime.now().month == self.current_month and datetime.now().year == self.current_year:
-                        bg_color = NORDIC_COLORS["calendar_today_bg"] # Today's date background (blue)
-                        fg_color = NORDIC_COLORS["calendar_today_fg"]   # Today's date foreground
-                        active_bg_color = NORDIC_COLORS["accent_blue"] # Darker blue for active today
-
-                # Using tk.Button directly with fg/bg
-                day_button = tk.Button(self.calendar_grid_frame,
-                                       text=f"{day_text}{event_indicator}",
-                                       width=10,
-                                       command=lambda d=day: self.show_day_events(d) if d != 0 else None,
-                                       font=('Arial', 10),
-                                       relief="raised",
-                                       borderwidth=1,
-                                       bg=bg_color,
-                                       fg=fg_color,
-                                       activebackground=active_bg_color,
-                                       activeforeground=active_fg_color)
-                day_button.grid(row=week_idx, column=day_idx, sticky="nsew", padx=1, pady=1)
-                self.calendar_grid_frame.grid_columnconfigure(day_idx, weight=1)
-            self.calendar_grid_frame.grid_rowconfigure(week_idx, weight=1)
-
-        self.show_day_events(datetime.now().day if datetime.now().month == self.current_month and datetime.now().year == self.current_year else 1) # Show events for today or 1st of month
+        self.calendar_weeks = month_weeks(self.current_year, self.current_month)
+        self._paint_calendar()
+
+        today = date.today()
+        self.show_day_events(today.day if (today.year, today.month) == (self.current_year, self.current_month) else 1) # Show events for today or 1st of month
+
+    def _paint_calendar(self, event=None):
+        """Paints the day cells of the current month onto the calendar canvas."""
+        canvas = self.calendar_canvas
+        if canvas is None or not self.calendar_weeks:
+            return
+
+        # Size the cells from the canvas; before it is mapped fall back to the requested size
+        width = event.width if event is not None else canvas.winfo_width()
+        height = event.height if event is not None else canvas.winfo_height()
+        if width <= 1 or height <= 1:
+            width, height = 700, int(canvas.cget("height"))
+        cell_w = width / 7
+        cell_h = height / len(self.calendar_weeks)
+
+        # Bind the palette entries used per cell to locals once
+        day_bg = NORDIC_COLORS["calendar_day_bg"]
+        day_fg = NORDIC_COLORS["calendar_day_fg"]
+        active_bg = NORDIC_COLORS["calendar_active_bg"]
+        event_bg = NORDIC_COLORS["calendar_event_bg"]
+        holiday_bg = NORDIC_COLORS["calendar_holiday_bg"]
+        holiday_fg = NORDIC_COLORS["accent_red"]
+        today_bg = NORDIC_COLORS["calendar_today_bg"]
+        today_fg = NORDIC_COLORS["calendar_today_fg"]
+        today_active_bg = NORDIC_COLORS["accent_blue"]
+        border = NORDIC_COLORS["border_color"]
+        # (background, foreground, indicator) by day flags & (EVENT_DAY | HOLIDAY_DAY); exam days use the plain event colours
+        day_styles = ((day_bg, day_fg, ""), (event_bg, day_fg, " •"), (day_bg, day_fg, ""), (holiday_bg, holiday_fg, " •"))
+        flags_for = self._calendar_day_flags().get
+        day_digits, style_bits = DAY_DIGITS, EVENT_DAY | HOLIDAY_DAY # Module globals read per cell, bound once too
+        today = date.today() # Read the clock once per paint; 0 never matches a day when another month is shown
+        today_day = today.day if (today.year, today.month) == (self.current_year, self.current_month) else 0
+        month_prefix = f"{self.current_year}-{self.current_month:02d}-" # Day keys are this plus DAY_DIGITS[day]
+
+        # The 6x7 cell items are created once and only moved and restyled afterwards; weeks past this month's are hidden.
+        # Day numbers stay disabled so the text never steals hover/clicks from its cell.
+        cells = self._calendar_cells
+        if not cells:
+            cells = self._calendar_cells = [(canvas.create_rectangle(0, 0, 0, 0, outline=border, tags=f"week{cell_idx // 7}"),
+                                             canvas.create_text(0, 0, anchor="nw", font=('Arial', 10), state="disabled", tags=f"week{cell_idx // 7}"))
+                                            for cell_idx in range(6 * 7)]
+        coords, itemconfigure = canvas.coords, canvas.itemconfigure
+        weeks = self.calendar_weeks
+        for week_idx in range(len(weeks), 6):
+            itemconfigure(f"week{week_idx}", state="hidden") # One call per unused week row instead of one per item
+        for cell_idx, (rect, text) in enumerate(cells[:len(weeks) * 7]):
+            week_idx, day_idx = divmod(cell_idx, 7)
+            day = weeks[week_idx][day_idx]
+            x = day_idx * cell_w
+            y = week_idx * cell_h
+            coords(rect, x + 1, y + 1, x + cell_w - 1, y + cell_h - 1)
+            if day == 0:
+                itemconfigure(rect, state="normal", fill=day_bg, activefill="")
+                itemconfigure(text, state="hidden")
+                continue
+
+            current_date_str = month_prefix + day_digits[day]
+            bg_color, fg_color, event_indicator = day_styles[flags_for(current_date_str, 0) & style_bits]
+            active_bg_color = active_bg
+
+            if day == today_day:
+                bg_color = today_bg # Today's date background (blue)
+                fg_color = today_fg   # Today's date foreground
+                active_bg_color = today_active_bg # Darker blue for active today
+
+            itemconfigure(rect, state="normal", fill=bg_color, activefill=active_bg_color)
+            coords(text, x + 6, y + 4)
+            itemconfigure(text, state="disabled", text=f"{day}{event_indicator}", fill=fg_color)
+
+    def on_calendar_click(self, event):
+        """Maps a click on the calendar canvas to its day cell and shows that day's events."""
+        if not self.calendar_weeks:
+            return
+        width = max(self.calendar_canvas.winfo_width(), 1)
+        height = max(self.calendar_canvas.winfo_height(), 1)
+        col = int(event.x * 7 // width)
+        row = int(event.y * len(self.calendar_weeks) // height)
+        if 0 <= row < len(self.calendar_weeks) and 0 <= col < 7:
+            day = self.calendar_weeks[row][col]
+            if day != 0:
+                self.show_day_events(day)
 
     def prev_month(self):
         """Navigates to the previous month in the calendar."""
@@ -2359,7 +2840,7 @@ class AcademicManagementApp(tk.Tk):
         if self.current_month < 1:
             self.current_month = 12
             self.current_year -= 1
-        self.draw_calendar()
+        self._debounced("calendar", self.draw_calendar)
 
     def next_month(self):
         """Navigates to the next month in the calendar."""
@@ -2367,50 +2848,48 @@ class AcademicManagementApp(tk.Tk):
         if self.current_month > 12:
             self.current_month = 1
             self.current_year += 1
-        self.draw_calendar()
+        self._debounced("calendar", self.draw_calendar)
 
     def show_day_events(self, day):
         """Displays events for the selected day in the event list."""
         if self.event_list_tree is None: # Check if Treeview is initialized
             return
 
-        for item in self.event_list_tree.get_children():
-            self.event_list_tree.delete(item)
-        # Configure alternating row colors for this Treeview
-        self.event_list_tree.tag_configure('oddrow', background=NORDIC_COLORS["treeview_row_bg1"])
-        self.event_list_tree.tag_configure('evenrow', background=NORDIC_COLORS["treeview_row_bg2"])
+        self.event_list_tree.delete(*self.event_list_tree.get_children()) # One Tcl call instead of one per row
+        self._listed_events.clear()
 
         if day == 0: # No day selected (empty calendar cell)
-            self.event_date_entry.delete(0, tk.END)
-            self.event_date_entry.insert(0, "")
+            self.event_date_var.set("")
             return
 
-        selected_date_str = f"{self.current_year}-{self.current_month:02d}-{day:02d}"
-        self.event_date_entry.delete(0, tk.END)
-        self.event_date_entry.insert(0, selected_date_str)
+        selected_date_str = f"{self.current_year}-{self.current_month:02d}-{DAY_DIGITS[day]}"
+        self.event_date_var.set(selected_date_str)
 
-        events_on_day = [e for e in self.calendar_events if e['date'] == selected_date_str]
+        events_on_day = self._group_by("calendar_events", "date").get(selected_date_str)
         if not events_on_day:
             self.event_list_tree.insert("", "end", values=("No events for this day.", ""))
         else:
+            listed = self._listed_events
+            rows = []
             for i, event in enumerate(events_on_day):
-                tag = 'evenrow' if i % 2 == 0 else 'oddrow'
-                self.event_list_tree.insert("", "end", iid=f"event_{i}_{selected_date_str}", values=(event['description'], event['type']), tags=(tag,))
+                iid = f"event_{event['id']}"
+                listed[iid] = event
+                rows.append((iid, (event['description'], event['type']), ROW_TAGS[i & 1]))
+            append_rows(self.event_list_tree, rows)
 
     def add_calendar_event(self):
         """Adds a new event to the calendar and saves it."""
-        event_date_str = self.event_date_entry.get().strip()
-        description = self.event_desc_entry.get().strip()
+        event_date_str = self.event_date_var.get().strip()
+        description = self.event_desc_var.get().strip()
         event_type = self.event_type_var.get()
 
         if not event_date_str or not description:
             messagebox.showwarning("Input Error", "Please enter both date and description for the event.", parent=self)
             return
 
-        try:
-            # Validate date format
-            datetime.strptime(event_date_str, "%Y-%m-%d")
-        except ValueError:
+        # Validate date format and store it zero-padded so it sorts and compares as text
+        event_date_str = parse_date(event_date_str)
+        if event_date_str is None:
             messagebox.showerror("Invalid Date", "Please enter date inYYYY-MM-DD format.", parent=self)
             return
 
@@ -2419,13 +2898,16 @@ class AcademicManagementApp(tk.Tk):
             "description": description,
             "type": event_type
         }
-        self.calendar_events.append(new_event)
-        self.save_json_data(self.calendar_events, CALENDAR_EVENTS_FILE)
-        self.event_desc_entry.delete(0, tk.END)
-        self.draw_calendar() # Redraw calendar to show new event
-        self.show_day_events(int(event_date_str.split('-')[2])) # Refresh event list for that day
-        messagebox.showinfo("Success", "Event added to calendar.", parent=self)
-        self.update_dashboard_info()
+        self._load_table("calendar_events") # Make sure the in-memory list is current before patching it
+        new_id = self.db_manager.insert_data("calendar_events", new_event)
+        if not new_id:
+            return
+        self._apply_local_change("calendar_events", new_id, {"id": new_id, **new_event})
+        self.event_desc_var.set("")
+        # Redraw now (dropping any pending redraw): draw_calendar() lists today's events, so the day shown next must come after it
+        self._debounced("calendar", self.draw_calendar, immediate=True)
+        self.show_day_events(int(event_date_str[8:])) # Refresh event list for that day; parse_date() returned it zero-padded
+        self.show_status("Event added to calendar.")
 
     def delete_selected_calendar_event(self):
         """Deletes the selected calendar event."""
@@ -2438,36 +2920,19 @@ class AcademicManagementApp(tk.Tk):
             messagebox.showwarning("No Selection", "Please select an event to delete.", parent=self)
             return
 
-        # The iid contains "event_{index_in_filtered_list}_{date_string}"
-        # We need to find the actual event in self.calendar_events
-        item_id_parts = selected_item[0].split('_')
-        if len(item_id_parts) != 3:
+        event_to_delete = self._listed_events.get(selected_item[0]) # None for the "No events" placeholder row
+        if event_to_delete is None:
             messagebox.showerror("Error", "Could not identify event for deletion.", parent=self)
             return
 
-        selected_date_str = item_id_parts[2]
-        selected_event_index_in_filtered_list = int(item_id_parts[1])
-
-        # Filter events for the selected date to find the correct one
-        events_on_selected_day = [e for e in self.calendar_events if e['date'] == selected_date_str]
-
-        if selected_event_index_in_filtered_list < len(events_on_selected_day):
-            event_to_delete = events_on_selected_day[selected_event_index_in_filtered_list]
-            
-            # Find the actual index in the main list
-            try:
-                actual_index = self.calendar_events.index(event_to_delete)
-                if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete the event '{event_to_delete['description']}'?", parent=self):
-                    del self.calendar_events[actual_index]
-                    self.save_json_data(self.calendar_events, CALENDAR_EVENTS_FILE)
-                    self.draw_calendar() # Redraw calendar to update event indicators
-                    self.show_day_events(int(selected_date_str.split('-')[2])) # Refresh event list
-                    messagebox.showinfo("Deleted", "Event deleted successfully.", parent=self)
-                    self.update_dashboard_info()
-            except ValueError:
-                messagebox.showerror("Error", "Event not found in the main list.", parent=self)
-        else:
-            messagebox.showerror("Error", "Selected event index is out of bounds.", parent=self)
+        if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete the event '{event_to_delete['description']}'?", parent=self):
+            event_id = event_to_delete['id']
+            if not self.db_manager.delete_data("calendar_events", event_id):
+                return
+            self._apply_local_change("calendar_events", event_id)
+            self._debounced("calendar", self.draw_calendar, immediate=True) # Redraw now, before re-listing the day, as in add_calendar_event()
+            self.show_day_events(int(event_to_delete['date'][8:])) # Refresh event list
+            self.show_status("Event deleted successfully.")
 
     # --- Alumni Directory Tab (Placeholder) ---
     def init_alumni_directory(self):
@@ -2530,6 +2995,9 @@ class AcademicManagementApp(tk.Tk):
 
 
 if __name__ == "__main__":
-    app = AcademicManagementApp()
+    parser = argparse.ArgumentParser(description="ELL Academic Management System")
+    parser.add_argument("--memory", action="store_true", help="run against a disposable in-memory database")
+    args = parser.parse_args()
+    app = AcademicManagementApp(db_path=":memory:" if args.memory else None)
     app.mainloop()
 